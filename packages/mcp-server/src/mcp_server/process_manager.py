@@ -6,11 +6,12 @@ monitors process health, and handles resource management.
 """
 
 import asyncio
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 from shared.account_manager import (
@@ -20,6 +21,7 @@ from shared.account_manager import (
 
 # Import components
 from .tiger_process_pool import (
+    HEALTHY_STATUSES,
     ProcessInfo,
     ProcessStatus,
     get_process_pool,
@@ -83,6 +85,7 @@ class ProcessManager:
         auto_scale_enabled: bool = True,
         min_processes: int = 1,
         max_processes_per_account: int = 1,
+        health_cache_ttl: float = 30.0,
     ):
         """
         Initialize process manager.
@@ -95,6 +98,7 @@ class ProcessManager:
             auto_scale_enabled: Enable automatic scaling
             min_processes: Minimum number of processes to maintain
             max_processes_per_account: Maximum processes per account
+            health_cache_ttl: Seconds a cached health check result stays valid
         """
         self.load_balance_strategy = load_balance_strategy
         self.max_concurrent_tasks = max_concurrent_tasks
@@ -103,6 +107,7 @@ class ProcessManager:
         self.auto_scale_enabled = auto_scale_enabled
         self.min_processes = min_processes
         self.max_processes_per_account = max_processes_per_account
+        self.health_cache_ttl = health_cache_ttl
 
         # Components
         self.process_pool = get_process_pool()
@@ -112,6 +117,8 @@ class ProcessManager:
         self.process_metrics: Dict[str, ProcessMetrics] = {}
         self.task_history: List[Dict[str, Any]] = []
         self.round_robin_index = 0
+        # account_id -> (monotonic timestamp, worker pid, health check result)
+        self._health_cache: Dict[str, Tuple[float, Optional[int], Dict[str, Any]]] = {}
 
         # Background tasks
         self._health_monitor_task: Optional[asyncio.Task] = None
@@ -204,14 +211,7 @@ class ProcessManager:
             logger.debug(f"Executing API call {method} for account {account_id}")
 
             # Validate account
-            account = await self.account_manager.get_account_by_id(
-                uuid.UUID(account_id)
-            )
-            if not account:
-                raise RuntimeError(f"Account {account_id} not found")
-
-            if account.status != AccountStatus.ACTIVE:
-                raise RuntimeError(f"Account {account.account_number} is not active")
+            await self._validate_account(account_id)
 
             # Execute on process pool
             result = await self.process_pool.execute_task(
@@ -243,12 +243,93 @@ class ProcessManager:
             logger.error(f"API call {method} failed: {e}")
             raise
 
+    async def execute_api_calls(
+        self,
+        account_id: str,
+        calls: List[Tuple[str, Optional[List[Any]], Optional[Dict[str, Any]]]],
+        timeout: float = 30.0,
+    ) -> List[Any]:
+        """
+        Execute several API calls on an account's worker as one task.
+
+        The calls travel to the worker in a single queue message and their
+        results come back in a single response, so the account is validated
+        and the queue round trip is paid once for the whole batch.
+
+        Args:
+            account_id: Tiger account ID
+            calls: (method, args, kwargs) tuples; args and kwargs may be None
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One entry per call, in order: the call result, or a RuntimeError
+            describing why that call failed
+
+        Raises:
+            RuntimeError: If the batch as a whole fails
+        """
+        start_time = datetime.utcnow()
+        task_id = str(uuid.uuid4())
+
+        try:
+            logger.debug(
+                f"Executing batch of {len(calls)} API calls for account {account_id}"
+            )
+
+            await self._validate_account(account_id)
+
+            responses = await self.process_pool.execute_task(
+                account_id=account_id,
+                method="batch",
+                args=[[list(call) for call in calls]],
+                timeout=timeout,
+            )
+
+            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            await self._record_task_completion(
+                task_id, account_id, "batch", True, execution_time
+            )
+
+            logger.debug(
+                f"Batch of {len(calls)} API calls completed in {execution_time:.2f}s"
+            )
+            return [
+                (
+                    response["result"]
+                    if response["success"]
+                    else RuntimeError(f"API call {method} failed: {response['error']}")
+                )
+                for (method, _, _), response in zip(calls, responses)
+            ]
+
+        except Exception as e:
+            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            await self._record_task_completion(
+                task_id, account_id, "batch", False, execution_time, str(e)
+            )
+
+            logger.error(f"Batch of {len(calls)} API calls failed: {e}")
+            raise
+
     async def get_account_process_status(
         self, account_id: str
     ) -> Optional[ProcessInfo]:
         """Get status of process handling the specified account."""
         return await self.process_pool.get_process_status(account_id)
 
+    async def wait_for_ready(self, account_id: str, timeout: float = 30.0) -> bool:
+        """
+        Wait until the process handling the account signals ready.
+
+        Args:
+            account_id: Account ID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the process is ready, False if the timeout expired
+        """
+        return await self.process_pool.wait_until_ready(account_id, timeout=timeout)
+
     async def get_all_process_status(self) -> List[ProcessInfo]:
         """Get status of all processes."""
         return await self.process_pool.get_all_processes()
@@ -325,6 +406,7 @@ class ProcessManager:
             logger.info(f"Restarting process for account {account_id}")
 
             success = await self.process_pool.restart_process(account_id)
+            self._health_cache.pop(account_id, None)
 
             if success:
                 # Reset metrics for the restarted process
@@ -371,16 +453,32 @@ class ProcessManager:
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
-    async def health_check_all_accounts(self) -> List[Dict[str, Any]]:
-        """Perform health check for all active accounts."""
+    async def health_check_all_accounts(
+        self, use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform health check for all active accounts.
+
+        Args:
+            use_cache: Reuse results younger than ``health_cache_ttl`` instead
+                of probing the worker process again
+
+        Returns:
+            List of health check results
+        """
         try:
             # Get all active accounts
             accounts = await self.account_manager.list_accounts(
-                status=AccountStatus.ACTIVE, include_inactive=False
+                status=AccountStatus.ACTIVE,
+                include_inactive=False,
+                load_relationships=False,
             )
 
             # Run health checks concurrently
-            tasks = [self.health_check_account(str(account.id)) for account in accounts]
+            check = (
+                self._cached_health_check if use_cache else self.health_check_account
+            )
+            tasks = [check(str(account.id)) for account in accounts]
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -407,6 +505,44 @@ class ProcessManager:
 
     # Private methods
 
+    async def _cached_health_check(self, account_id: str) -> Dict[str, Any]:
+        """
+        Return a fresh cached health check result or run a new check.
+
+        Only healthy results are cached, and an entry is only reused while the
+        same worker pid serves the account, so pool-internal restarts (timeouts,
+        repeated errors, dead workers) invalidate it without explicit eviction.
+        """
+        process = await self.process_pool.get_process_status(account_id)
+        pid = process.pid if process else None
+
+        cached = self._health_cache.get(account_id)
+        if (
+            cached
+            and cached[1] == pid
+            and time.monotonic() - cached[0] < self.health_cache_ttl
+        ):
+            return cached[2]
+
+        result = await self.health_check_account(account_id)
+        if result.get("healthy"):
+            # Re-read the pid: the check may have spawned the worker
+            process = await self.process_pool.get_process_status(account_id)
+            pid = process.pid if process else None
+            self._health_cache[account_id] = (time.monotonic(), pid, result)
+        else:
+            self._health_cache.pop(account_id, None)
+        return result
+
+    async def _validate_account(self, account_id: str) -> None:
+        """Raise RuntimeError unless the account exists and is active."""
+        account = await self.account_manager.get_account_by_id(uuid.UUID(account_id))
+        if not account:
+            raise RuntimeError(f"Account {account_id} not found")
+
+        if account.status != AccountStatus.ACTIVE:
+            raise RuntimeError(f"Account {account.account_number} is not active")
+
     async def _record_task_completion(
         self,
         task_id: str,
@@ -583,9 +719,7 @@ class ProcessManager:
                 # Check if process is stuck
                 if (
                     process.status == ProcessStatus.BUSY
-                    and process.last_heartbeat
-                    and (datetime.utcnow() - process.last_heartbeat).total_seconds()
-                    > 300
+                    and (time.monotonic_ns() - process.last_heartbeat_ns) / 1e9 > 300
                 ):
                     logger.warning(
                         f"Process {process.process_id} appears stuck, restarting"
@@ -601,11 +735,7 @@ class ProcessManager:
         try:
             # Get current process count and load
             processes = await self.get_all_process_status()
-            active_processes = [
-                p
-                for p in processes
-                if p.status in [ProcessStatus.READY, ProcessStatus.BUSY]
-            ]
+            active_processes = [p for p in processes if p.status in HEALTHY_STATUSES]
 
             # Simple auto-scaling logic - this could be enhanced
             if len(active_processes) < self.min_processes:
@@ -6,13 +6,16 @@ Each process handles one Tiger account with SDK loaded at fixed path.
 """
 
 import asyncio
+import ctypes
+import itertools
 import multiprocessing as mp
+import struct
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import Enum
+from multiprocessing.connection import Connection
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -22,6 +25,22 @@ from shared.account_manager import get_account_manager
 from shared.config import get_config
 
 
+# Control frames on the worker pipes: a tag byte and a nanosecond timestamp.
+# Tasks and results are pickled, and a pickle always starts with the PROTO
+# opcode (0x80), so the first byte of a message tells the two apart.
+CONTROL_FRAME = struct.Struct("<BQ")
+TAG_HEARTBEAT = 1
+TAG_SHUTDOWN = 2
+
+
+# Worker heartbeat stamps live in one shared int64 array, one 64-byte cache
+# line (8 entries) per worker slot, so workers on different cores never write
+# to the same line. A worker writes its monotonic clock at slot * stride when
+# it answers a heartbeat or finishes a task; the monitor reads every stamp
+# without a pipe round trip.
+HEARTBEAT_STRIDE = 8
+
+
 class ProcessStatus(Enum):
     """Process status enumeration."""
 
@@ -33,7 +52,11 @@ class ProcessStatus(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+# Statuses in which a worker takes tasks, tested with one hashed lookup
+HEALTHY_STATUSES = frozenset({ProcessStatus.READY, ProcessStatus.BUSY})
+
+
+@dataclass(slots=True)
 class ProcessInfo:
     """Information about a worker process."""
 
@@ -42,51 +65,53 @@ class ProcessInfo:
     account_number: str
     pid: Optional[int] = None
     status: ProcessStatus = ProcessStatus.STARTING
-    created_at: datetime = None
-    last_heartbeat: datetime = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    last_heartbeat_ns: int = field(default_factory=time.monotonic_ns)
     error_count: int = 0
-    current_task: Optional[str] = None
+    task_count: int = 0
+    current_task: Optional[int] = None
     memory_usage: Optional[float] = None
     cpu_usage: Optional[float] = None
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.utcnow()
-        if self.last_heartbeat is None:
-            self.last_heartbeat = datetime.utcnow()
+    def mark_busy(self, task_id: int) -> None:
+        """Record that the worker started a task."""
+        self.status = ProcessStatus.BUSY
+        self.current_task = task_id
+
+    def mark_ready(self, now_ns: int) -> None:
+        """Record that the worker is idle, counting it as a heartbeat."""
+        self.status = ProcessStatus.READY
+        self.current_task = None
+        self.last_heartbeat_ns = now_ns
 
+    @property
+    def last_heartbeat(self) -> datetime:
+        """Wall-clock time of the last heartbeat, for reporting."""
+        age_ns = time.monotonic_ns() - self.last_heartbeat_ns
+        return datetime.utcnow() - timedelta(microseconds=age_ns // 1000)
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskRequest:
-    """Task request for worker process."""
+    """Task request for worker process, sent over the pipe as-is."""
 
-    task_id: str
+    task_id: int
     method: str
-    args: List[Any] = None
-    kwargs: Dict[str, Any] = None
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
     timeout: float = 30.0
 
-    def __post_init__(self):
-        if self.args is None:
-            self.args = []
-        if self.kwargs is None:
-            self.kwargs = {}
-
 
-@dataclass
+@dataclass(slots=True)
 class TaskResponse:
-    """Task response from worker process."""
+    """Task response from worker process, received over the pipe as-is."""
 
-    task_id: str
+    task_id: int
     success: bool
     result: Any = None
     error: Optional[str] = None
     execution_time: float = 0.0
-    timestamp: datetime = None
-
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+    timestamp: int = field(default_factory=time.monotonic_ns)
 
 
 class TigerProcessPool:
@@ -105,6 +130,9 @@ class TigerProcessPool:
         heartbeat_interval: float = 10.0,
         max_restarts: int = 3,
         restart_cooldown: float = 60.0,
+        prewarm_accounts: Optional[List[str]] = None,
+        max_tasks_per_process: Optional[int] = None,
+        prefetch_depth: int = 2,
     ):
         """
         Initialize the Tiger process pool.
@@ -115,6 +143,11 @@ class TigerProcessPool:
             heartbeat_interval: Heartbeat check interval
             max_restarts: Maximum restart attempts per process
             restart_cooldown: Cooldown between restart attempts
+            prewarm_accounts: Account IDs whose workers are started by start()
+            max_tasks_per_process: Recycle an idle worker after this many tasks
+                (default: never)
+            prefetch_depth: Tasks queued on a worker's pipe at once, so the
+                worker reads the next request while finishing the current one
         """
         self.config = get_config()
         self.account_manager = get_account_manager()
@@ -125,16 +158,32 @@ class TigerProcessPool:
         self.heartbeat_interval = heartbeat_interval
         self.max_restarts = max_restarts
         self.restart_cooldown = restart_cooldown
+        self.prewarm_accounts = list(prewarm_accounts or [])
+        self.max_tasks_per_process = max_tasks_per_process
+        self.prefetch_depth = prefetch_depth
 
         # Process tracking
         self.processes: Dict[str, ProcessInfo] = {}  # process_id -> ProcessInfo
         self.account_to_process: Dict[str, str] = {}  # account_id -> process_id
         self.process_pool: Dict[str, mp.Process] = {}  # process_id -> Process
-        self.task_queues: Dict[str, mp.Queue] = {}  # process_id -> Queue
-        self.result_queues: Dict[str, mp.Queue] = {}  # process_id -> Queue
+        self.task_conns: Dict[str, Connection] = {}  # process_id -> send end
+        self.result_conns: Dict[str, Connection] = {}  # process_id -> recv end
+        # process_id -> task_id -> Future resolved by _on_result_ready
+        self._pending: Dict[str, Dict[int, asyncio.Future]] = {}
+        self._in_flight: Dict[str, asyncio.Semaphore] = {}  # process_id -> limit
+        self._task_ids = itertools.count(1)  # unique for the pool's lifetime
+        self._exit_watchers: Dict[str, int] = {}  # process_id -> watched sentinel
+        self._exit_restarts: Dict[str, asyncio.Task] = {}  # process_id -> restart
+        self._ready_events: Dict[str, asyncio.Event] = {}  # account_id -> Event
+
+        # Shared heartbeat stamps, indexed by worker slot
+        self._heartbeat_ns = mp.RawArray(
+            ctypes.c_int64, self.max_processes * HEARTBEAT_STRIDE
+        )
+        self._slot_process: List[Optional[str]] = [None] * self.max_processes
+        self._process_slot: Dict[str, int] = {}  # process_id -> slot
 
-        # Threading for async operations
-        self.thread_pool = ThreadPoolExecutor(max_workers=self.max_processes)
+        # Monitoring
         self._monitoring_active = False
         self._monitoring_task: Optional[asyncio.Task] = None
 
@@ -154,6 +203,21 @@ class TigerProcessPool:
             self._monitoring_active = True
             self._monitoring_task = asyncio.create_task(self._monitor_processes())
 
+            # Start workers for known accounts so first calls find them ready
+            if self.prewarm_accounts:
+                results = await asyncio.gather(
+                    *(
+                        self.get_or_create_process(account_id)
+                        for account_id in self.prewarm_accounts
+                    ),
+                    return_exceptions=True,
+                )
+                for account_id, result in zip(self.prewarm_accounts, results):
+                    if isinstance(result, Exception):
+                        logger.warning(
+                            f"Failed to prewarm worker for account {account_id}: {result}"
+                        )
+
             logger.info("Tiger process pool started successfully")
 
         except Exception as e:
@@ -178,9 +242,6 @@ class TigerProcessPool:
             # Stop all processes
             await self._stop_all_processes()
 
-            # Clean up thread pool
-            self.thread_pool.shutdown(wait=True)
-
             logger.info("Tiger process pool stopped")
 
         except Exception as e:
@@ -206,23 +267,15 @@ class TigerProcessPool:
                 process_id = self.account_to_process[account_id]
                 process_info = self.processes.get(process_id)
 
-                if process_info and process_info.status in [
-                    ProcessStatus.READY,
-                    ProcessStatus.BUSY,
-                ]:
+                if process_info and process_info.status in HEALTHY_STATUSES:
                     return process_id
                 else:
                     # Process is not healthy, remove and recreate
                     await self._remove_process(process_id)
 
-            # Check process limit
-            active_processes = sum(
-                1
-                for p in self.processes.values()
-                if p.status not in [ProcessStatus.STOPPED, ProcessStatus.ERROR]
-            )
-
-            if active_processes >= self.max_processes:
+            # Check process limit; every tracked process holds a worker and a
+            # heartbeat slot until _remove_process drops it
+            if len(self.processes) >= self.max_processes:
                 raise RuntimeError(f"Maximum processes ({self.max_processes}) reached")
 
             # Create new process
@@ -261,77 +314,99 @@ class TigerProcessPool:
         try:
             # Get or create process for account
             process_id = await self.get_or_create_process(account_id)
-            process_info = self.processes[process_id]
-
-            # Mark process as busy
-            process_info.status = ProcessStatus.BUSY
-            task_id = str(uuid.uuid4())
-            process_info.current_task = task_id
-
-            # Create task request
-            task_request = TaskRequest(
-                task_id=task_id,
-                method=method,
-                args=args or [],
-                kwargs=kwargs or {},
-                timeout=timeout,
-            )
-
-            # Submit task to worker process
-            task_queue = self.task_queues[process_id]
-            result_queue = self.result_queues[process_id]
 
-            # Send task request
-            await self._put_queue_async(task_queue, asdict(task_request), timeout=5.0)
+            # Bound the requests queued on this worker's pipe
+            async with self._in_flight[process_id]:
+                return await self._submit_task(
+                    process_id, method, args, kwargs, timeout
+                )
 
-            # Wait for result
-            start_time = time.time()
-            try:
-                result_data = await self._get_queue_async(result_queue, timeout=timeout)
-                execution_time = time.time() - start_time
-
-                # Parse response
-                task_response = TaskResponse(**result_data)
+        except Exception as e:
+            logger.error(
+                f"Failed to execute task {method} on account {account_id}: {e}"
+            )
+            raise
 
-                # Update process status
-                process_info.status = ProcessStatus.READY
-                process_info.current_task = None
-                process_info.last_heartbeat = datetime.utcnow()
+    async def _submit_task(
+        self,
+        process_id: str,
+        method: str,
+        args: Optional[List[Any]],
+        kwargs: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Any:
+        """Send one task to a worker and wait for its response."""
+        process_info = self.processes.get(process_id)
+        if process_info is None:
+            raise RuntimeError(f"Worker process {process_id} stopped")
+        task_conn = self.task_conns[process_id]
+        pending = self._pending[process_id]
+
+        # Mark process as busy
+        task_id = next(self._task_ids)
+        process_info.mark_busy(task_id)
+
+        # Create task request
+        task_request = TaskRequest(
+            task_id=task_id,
+            method=method,
+            args=args or [],
+            kwargs=kwargs or {},
+            timeout=timeout,
+        )
 
-                if task_response.success:
-                    logger.debug(f"Task {task_id} completed in {execution_time:.2f}s")
-                    return task_response.result
-                else:
-                    # Task failed
-                    error_msg = task_response.error or "Unknown error"
-                    logger.error(f"Task {task_id} failed: {error_msg}")
-
-                    # Increment error count
-                    process_info.error_count += 1
-                    if process_info.error_count >= 3:
-                        # Too many errors, restart process
-                        logger.warning(
-                            f"Process {process_id} has too many errors, restarting..."
-                        )
-                        await self._restart_process(process_id)
+        # Register for the response before sending, so it cannot be missed
+        future = asyncio.get_running_loop().create_future()
+        pending[task_id] = future
 
-                    raise RuntimeError(f"Task execution failed: {error_msg}")
+        # Send task request
+        await self._send_async(task_conn, task_request)
 
-            except TimeoutError:
-                # Task timed out
-                process_info.status = ProcessStatus.ERROR
-                process_info.current_task = None
-                logger.error(f"Task {task_id} timed out after {timeout}s")
+        # Wait for result
+        start_ns = time.monotonic_ns()
+        try:
+            task_response = await asyncio.wait_for(future, timeout=timeout)
+            end_ns = time.monotonic_ns()
+            execution_time = (end_ns - start_ns) / 1e9
 
-                # Consider restarting process after timeout
-                await self._restart_process(process_id)
-                raise TimeoutError(f"Task execution timed out after {timeout}s")
+            # Update process status; stay BUSY while other tasks are in flight
+            if len(pending) == 1:
+                process_info.mark_ready(end_ns)
+            else:
+                process_info.last_heartbeat_ns = end_ns
+            process_info.task_count += 1
 
-        except Exception as e:
-            logger.error(
-                f"Failed to execute task {method} on account {account_id}: {e}"
-            )
-            raise
+            if task_response.success:
+                logger.debug(f"Task {task_id} completed in {execution_time:.2f}s")
+                return task_response.result
+            else:
+                # Task failed
+                error_msg = task_response.error or "Unknown error"
+                logger.error(f"Task {task_id} failed: {error_msg}")
+
+                # Increment error count
+                process_info.error_count += 1
+                if process_info.error_count >= 3:
+                    # Too many errors, restart process
+                    logger.warning(
+                        f"Process {process_id} has too many errors, restarting..."
+                    )
+                    await self._restart_process(process_id)
+
+                raise RuntimeError(f"Task execution failed: {error_msg}")
+
+        except TimeoutError:
+            # Task timed out
+            process_info.status = ProcessStatus.ERROR
+            process_info.current_task = None
+            logger.error(f"Task {task_id} timed out after {timeout}s")
+
+            # Consider restarting process after timeout
+            await self._restart_process(process_id)
+            raise TimeoutError(f"Task execution timed out after {timeout}s")
+
+        finally:
+            pending.pop(task_id, None)
 
     async def get_process_status(self, account_id: str) -> Optional[ProcessInfo]:
         """Get status of process handling the specified account."""
@@ -344,6 +419,24 @@ class TigerProcessPool:
         """Get status of all processes."""
         return list(self.processes.values())
 
+    async def wait_until_ready(self, account_id: str, timeout: float = 30.0) -> bool:
+        """
+        Wait until the worker process for the account signals ready.
+
+        Args:
+            account_id: Tiger account ID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the worker is ready, False if the timeout expired
+        """
+        event = self._get_ready_event(account_id)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def restart_process(self, account_id: str) -> bool:
         """
         Restart process for the specified account.
@@ -371,11 +464,21 @@ class TigerProcessPool:
         """
         process_id = self.account_to_process.get(account_id)
         if process_id:
-            return await self._remove_process(process_id)
+            removed = await self._remove_process(process_id)
+            if removed:
+                self._ready_events.pop(account_id, None)
+            return removed
         return False
 
     # Private methods
 
+    def _get_ready_event(self, account_id: str) -> asyncio.Event:
+        """Get the ready event for an account, creating it on first use."""
+        event = self._ready_events.get(account_id)
+        if event is None:
+            event = self._ready_events[account_id] = asyncio.Event()
+        return event
+
     async def _create_process(self, process_id: str, account_id: str) -> str:
         """Create a new worker process."""
         try:
@@ -394,52 +497,81 @@ class TigerProcessPool:
                 status=ProcessStatus.STARTING,
             )
 
-            # Create communication queues
-            task_queue = mp.Queue()
-            result_queue = mp.Queue()
+            # Create one-way pipes: tasks parent -> worker, results worker -> parent
+            worker_task_conn, task_conn = mp.Pipe(duplex=False)
+            result_conn, worker_result_conn = mp.Pipe(duplex=False)
+
+            # Claim a heartbeat slot, counted from now until the worker writes it
+            slot = self._claim_heartbeat_slot(process_id)
 
             # Start worker process
             from .tiger_worker import tiger_worker_main
 
             process = mp.Process(
                 target=tiger_worker_main,
-                args=(process_id, account_id, task_queue, result_queue),
+                args=(
+                    process_id,
+                    account_id,
+                    worker_task_conn,
+                    worker_result_conn,
+                    self._heartbeat_ns,
+                    slot,
+                ),
                 name=f"tiger_worker_{account.account_number}",
             )
             process.start()
 
+            # The worker owns its ends now; closing ours lets a dead worker
+            # show up as EOF on the result pipe
+            worker_task_conn.close()
+            worker_result_conn.close()
+
             # Update tracking
             process_info.pid = process.pid
             self.processes[process_id] = process_info
             self.account_to_process[account_id] = process_id
             self.process_pool[process_id] = process
-            self.task_queues[process_id] = task_queue
-            self.result_queues[process_id] = result_queue
+            self.task_conns[process_id] = task_conn
+            self.result_conns[process_id] = result_conn
+            self._pending[process_id] = {}
+            self._in_flight[process_id] = asyncio.Semaphore(self.prefetch_depth)
+
+            # Deliver worker messages on the event loop as they arrive
+            asyncio.get_running_loop().add_reader(
+                result_conn.fileno(), self._on_result_ready, process_id
+            )
 
-            # Wait for process to be ready
+            # Wait for the ready signal (set by _on_result_ready) or for the
+            # worker to exit, whichever comes first
             ready_timeout = 30.0
-            start_time = time.time()
-
-            while time.time() - start_time < ready_timeout:
-                # Check if process is still alive
-                if not process.is_alive():
-                    raise RuntimeError("Worker process died during startup")
-
-                # Check for ready signal
-                try:
-                    if not result_queue.empty():
-                        ready_msg = result_queue.get_nowait()
-                        if ready_msg.get("type") == "ready":
-                            process_info.status = ProcessStatus.READY
-                            process_info.last_heartbeat = datetime.utcnow()
-                            logger.info(
-                                f"Worker process {process_id} is ready for account {account.account_number}"
-                            )
-                            return process_id
-                except:
-                    pass
-
-                await asyncio.sleep(0.5)
+            loop = asyncio.get_running_loop()
+            ready_wait = asyncio.ensure_future(self._get_ready_event(account_id).wait())
+            exited = loop.create_future()
+            loop.add_reader(
+                process.sentinel,
+                lambda: exited.done() or exited.set_result(None),
+            )
+            try:
+                done, _ = await asyncio.wait(
+                    {ready_wait, exited},
+                    timeout=ready_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                loop.remove_reader(process.sentinel)
+                ready_wait.cancel()
+
+            if ready_wait in done:
+                # From now on restart the worker as soon as it exits
+                loop.add_reader(process.sentinel, self._on_worker_exit, process_id)
+                self._exit_watchers[process_id] = process.sentinel
+                logger.info(
+                    f"Worker process {process_id} is ready for account {account.account_number}"
+                )
+                return process_id
+
+            if exited in done and not process.is_alive():
+                raise RuntimeError("Worker process died during startup")
 
             # Timeout waiting for ready signal
             await self._remove_process(process_id)
@@ -483,19 +615,29 @@ class TigerProcessPool:
 
             # Update status
             process_info.status = ProcessStatus.STOPPING
+            ready_event = self._ready_events.get(process_info.account_id)
+            if ready_event:
+                ready_event.clear()
+
+            # Stop watching for exit; this one is intended
+            sentinel = self._exit_watchers.pop(process_id, None)
+            if sentinel is not None:
+                asyncio.get_running_loop().remove_reader(sentinel)
 
             # Stop the process
             process = self.process_pool.get(process_id)
             if process and process.is_alive():
                 # Try graceful shutdown first
-                task_queue = self.task_queues.get(process_id)
-                if task_queue:
+                task_conn = self.task_conns.get(process_id)
+                if task_conn:
                     try:
-                        shutdown_task = {"type": "shutdown"}
-                        task_queue.put_nowait(shutdown_task)
+                        task_conn.send_bytes(
+                            CONTROL_FRAME.pack(TAG_SHUTDOWN, time.monotonic_ns())
+                        )
                         process.join(timeout=5.0)
-                    except:
-                        pass
+                    except (OSError, ValueError) as e:
+                        # Pipe already broken; fall through to terminate
+                        logger.debug(f"Shutdown signal to {process_id} failed: {e}")
 
                 # Force terminate if still alive
                 if process.is_alive():
@@ -518,11 +660,27 @@ class TigerProcessPool:
             if process_id in self.process_pool:
                 del self.process_pool[process_id]
 
-            if process_id in self.task_queues:
-                del self.task_queues[process_id]
+            task_conn = self.task_conns.pop(process_id, None)
+            if task_conn:
+                task_conn.close()
+
+            result_conn = self.result_conns.pop(process_id, None)
+            if result_conn:
+                asyncio.get_running_loop().remove_reader(result_conn.fileno())
+                result_conn.close()
+
+            slot = self._process_slot.pop(process_id, None)
+            if slot is not None:
+                self._slot_process[slot] = None
 
-            if process_id in self.result_queues:
-                del self.result_queues[process_id]
+            self._in_flight.pop(process_id, None)
+
+            # Fail tasks still waiting on this worker
+            for future in self._pending.pop(process_id, {}).values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError(f"Worker process {process_id} stopped")
+                    )
 
             process_info.status = ProcessStatus.STOPPED
             logger.info(f"Process {process_id} removed successfully")
@@ -543,13 +701,20 @@ class TigerProcessPool:
             except Exception as e:
                 logger.error(f"Error stopping process {process_id}: {e}")
 
+        self._ready_events.clear()
+
     async def _monitor_processes(self) -> None:
         """Monitor process health and perform maintenance."""
         logger.info("Process monitoring started")
 
         while self._monitoring_active and not self._shutdown:
             try:
-                current_time = datetime.utcnow()
+                now_ns = time.monotonic_ns()
+                timeout_ns = int(self.process_timeout * 1e9)
+                # Stamps newer than half an interval need no heartbeat
+                fresh_ns = int(self.heartbeat_interval * 0.5e9)
+                # Local copy of every worker's stamp in one C-level slice
+                stamps = self._heartbeat_ns[::HEARTBEAT_STRIDE]
 
                 # Check each process
                 for process_id, process_info in list(self.processes.items()):
@@ -557,34 +722,54 @@ class TigerProcessPool:
                         # Check if process is still alive
                         process = self.process_pool.get(process_id)
                         if process and not process.is_alive():
-                            logger.warning(f"Process {process_id} died unexpectedly")
-                            await self._restart_process(process_id)
+                            # Normally already handled by _on_worker_exit
+                            if process_id not in self._exit_restarts:
+                                logger.warning(
+                                    f"Process {process_id} died unexpectedly"
+                                )
+                                await self._restart_process(process_id)
                             continue
 
-                        # Check heartbeat timeout
-                        if process_info.last_heartbeat:
-                            heartbeat_age = (
-                                current_time - process_info.last_heartbeat
-                            ).total_seconds()
-                            if heartbeat_age > self.process_timeout:
+                        # Check heartbeat timeout against the worker's own stamp
+                        slot = self._process_slot.get(process_id)
+                        if slot is not None:
+                            last_ns = stamps[slot]
+                            process_info.last_heartbeat_ns = last_ns
+                            if now_ns - last_ns > timeout_ns:
                                 logger.warning(
-                                    f"Process {process_id} heartbeat timeout ({heartbeat_age:.1f}s)"
+                                    f"Process {process_id} heartbeat timeout ({(now_ns - last_ns) / 1e9:.1f}s)"
                                 )
                                 await self._restart_process(process_id)
                                 continue
 
-                        # Send heartbeat check if ready
-                        if process_info.status == ProcessStatus.READY:
-                            try:
-                                task_queue = self.task_queues.get(process_id)
-                                if task_queue:
-                                    heartbeat_task = {
-                                        "type": "heartbeat",
-                                        "timestamp": current_time.isoformat(),
-                                    }
-                                    task_queue.put_nowait(heartbeat_task)
-                            except:
-                                pass
+                        # Recycle long-lived workers once they are idle
+                        if (
+                            self.max_tasks_per_process
+                            and process_info.task_count >= self.max_tasks_per_process
+                            and not self._pending.get(process_id)
+                        ):
+                            logger.info(
+                                f"Recycling process {process_id} after {process_info.task_count} tasks"
+                            )
+                            await self._restart_process(process_id)
+                            continue
+
+                        # Send heartbeat check if ready and not recently active
+                        if (
+                            process_info.status == ProcessStatus.READY
+                            and now_ns - process_info.last_heartbeat_ns > fresh_ns
+                        ):
+                            task_conn = self.task_conns.get(process_id)
+                            if task_conn:
+                                try:
+                                    task_conn.send_bytes(
+                                        CONTROL_FRAME.pack(TAG_HEARTBEAT, now_ns)
+                                    )
+                                except (OSError, ValueError) as e:
+                                    # Exit watcher or heartbeat timeout restarts it
+                                    logger.debug(
+                                        f"Heartbeat to {process_id} failed: {e}"
+                                    )
 
                     except Exception as e:
                         logger.error(f"Error monitoring process {process_id}: {e}")
@@ -600,53 +785,117 @@ class TigerProcessPool:
 
         logger.info("Process monitoring stopped")
 
-    async def _put_queue_async(
-        self, queue: mp.Queue, item: Any, timeout: float = None
-    ) -> None:
-        """Put item in queue asynchronously."""
-        loop = asyncio.get_event_loop()
-
-        def _put():
-            if timeout:
-                # Use timeout for blocking put
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    try:
-                        queue.put_nowait(item)
-                        return True
-                    except:
-                        time.sleep(0.1)
-                raise TimeoutError("Queue put timeout")
-            else:
-                queue.put(item)
-                return True
+    def _on_worker_exit(self, process_id: str) -> None:
+        """
+        Restart a worker as soon as its process exits unexpectedly.
 
-        try:
-            await loop.run_in_executor(self.thread_pool, _put)
-        except Exception as e:
-            raise TimeoutError(f"Failed to put item in queue: {e}")
+        Called by the event loop when the worker's process sentinel becomes
+        readable, so a crash is noticed immediately rather than on the next
+        monitoring pass.
+        """
+        process = self.process_pool.get(process_id)
+        if process is None or process.is_alive():
+            return
+
+        sentinel = self._exit_watchers.pop(process_id, None)
+        if sentinel is not None:
+            asyncio.get_running_loop().remove_reader(sentinel)
+
+        process_info = self.processes.get(process_id)
+        if self._shutdown or process_info is None:
+            return
+
+        logger.warning(f"Process {process_id} died unexpectedly")
+        process_info.status = ProcessStatus.ERROR
+        restart = asyncio.create_task(self._restart_process(process_id))
+        self._exit_restarts[process_id] = restart
+        restart.add_done_callback(lambda _: self._exit_restarts.pop(process_id, None))
+
+    def _claim_heartbeat_slot(self, process_id: str) -> int:
+        """Assign a free heartbeat slot to a process and start its clock."""
+        slot = self._process_slot.get(process_id)
+        if slot is None:
+            try:
+                slot = self._slot_process.index(None)
+            except ValueError:
+                raise RuntimeError(
+                    f"No free heartbeat slot ({self.max_processes} in use)"
+                )
+            self._slot_process[slot] = process_id
+            self._process_slot[process_id] = slot
+
+        self._heartbeat_ns[slot * HEARTBEAT_STRIDE] = time.monotonic_ns()
+        return slot
+
+    async def _send_async(self, conn: Connection, item: Any) -> None:
+        """
+        Send item to a worker.
 
-    async def _get_queue_async(self, queue: mp.Queue, timeout: float = None) -> Any:
-        """Get item from queue asynchronously."""
-        loop = asyncio.get_event_loop()
+        Sends happen on the event loop thread, so messages from concurrent
+        tasks are written one after another and never interleave on the pipe.
+        """
+        try:
+            conn.send(item)
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"Failed to send item to worker: {e}")
 
-        def _get():
-            if timeout:
-                # Use timeout for blocking get
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    try:
-                        return queue.get_nowait()
-                    except:
-                        time.sleep(0.1)
-                raise TimeoutError("Queue get timeout")
-            else:
-                return queue.get()
+    def _on_result_ready(self, process_id: str) -> None:
+        """
+        Read every message waiting on a worker's result pipe.
 
-        try:
-            return await loop.run_in_executor(self.thread_pool, _get)
-        except Exception as e:
-            raise TimeoutError(f"Failed to get item from queue: {e}")
+        Called by the event loop when the pipe becomes readable. Task
+        responses resolve the future registered under their task_id, so
+        concurrent tasks on one worker always get their own result. Workers
+        send responses that finish together as one list.
+        """
+        conn = self.result_conns.get(process_id)
+        process_info = self.processes.get(process_id)
+        if conn is None or process_info is None:
+            return
+
+        pending = self._pending[process_id]
+        unreadable = None
+        while True:
+            try:
+                if not conn.poll():
+                    break
+                message = conn.recv()
+                if isinstance(message, TaskResponse):
+                    message = [message]
+                if isinstance(message, list):
+                    for response in message:
+                        future = pending.get(response.task_id)
+                        if future and not future.done():
+                            future.set_result(response)
+                    continue
+
+                # The one-off ready signal is a plain dict
+                if message.get("type") == "ready":
+                    process_info.mark_ready(time.monotonic_ns())
+                    self._get_ready_event(process_info.account_id).set()
+            except (EOFError, OSError):
+                # Worker exited; stop watching the pipe and let monitoring restart it
+                logger.warning(f"Result pipe of process {process_id} closed")
+                asyncio.get_running_loop().remove_reader(conn.fileno())
+                return
+            except Exception as e:
+                # Skip the bad message and keep draining the pipe
+                logger.opt(exception=True).error(
+                    f"Unreadable message from process {process_id}: {e}"
+                )
+                unreadable = e
+
+        if unreadable is not None:
+            # A message that could not be read carries no usable task_id, so
+            # fail the tasks it may have answered instead of letting them time out
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError(
+                            f"Unreadable result from worker process {process_id}: "
+                            f"{unreadable}"
+                        )
+                    )
 
 
 # Global process pool instance
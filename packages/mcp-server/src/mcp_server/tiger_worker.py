@@ -2,38 +2,77 @@
 Tiger Worker Process.
 
 Isolated worker process that loads Tiger SDK for one specific account.
-Handles API calls from the main process via queue communication.
+Handles API calls from the main process via pipe communication.
 """
 
+import asyncio
+import functools
 import json
 import multiprocessing as mp
+import os
+import pickle
 import sys
 import time
-import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from multiprocessing.connection import Connection
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
 
 # Set up logging for worker process
 from loguru import logger
 
-# Add the Tiger SDK path to sys.path
-TIGER_SDK_PATH = (
-    "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/references/openapi-python-sdk"
+from mcp_server.tiger_process_pool import (
+    HEARTBEAT_STRIDE,
+    TAG_HEARTBEAT,
+    TAG_SHUTDOWN,
+    TaskRequest,
+    TaskResponse,
 )
-if TIGER_SDK_PATH not in sys.path:
-    sys.path.insert(0, TIGER_SDK_PATH)
 
-try:
-    # Import Tiger SDK components
-    from tigeropen.push.push_client import PushClient
-    from tigeropen.quote.quote_client import QuoteClient
-    from tigeropen.tiger_open_client import TigerOpenClient
-    from tigeropen.tiger_open_config import TigerOpenClientConfig
-    from tigeropen.trade.trade_client import TradeClient
-except ImportError as e:
-    logger.error(f"Failed to import Tiger SDK: {e}")
-    raise
+
+@functools.lru_cache(maxsize=1)
+def _tiger_sdk() -> SimpleNamespace:
+    """Import the Tiger SDK on first use, once per process."""
+    # tigeropen normally comes from site-packages; TIGER_SDK_PATH can point
+    # at a local SDK checkout instead
+    sdk_path = os.getenv("TIGER_SDK_PATH")
+    if sdk_path and sdk_path not in sys.path:
+        sys.path.insert(0, sdk_path)
+
+    try:
+        # Import Tiger SDK components
+        from tigeropen.common.util import web_utils
+        from tigeropen.push.push_client import PushClient
+        from tigeropen.quote.quote_client import QuoteClient
+        from tigeropen.tiger_open_client import TigerOpenClient
+        from tigeropen.tiger_open_config import TigerOpenClientConfig
+        from tigeropen.trade.trade_client import TradeClient
+    except ImportError as e:
+        logger.error(f"Failed to import Tiger SDK: {e}")
+        raise
+
+    return SimpleNamespace(
+        web_utils=web_utils,
+        PushClient=PushClient,
+        QuoteClient=QuoteClient,
+        TigerOpenClient=TigerOpenClient,
+        TigerOpenClientConfig=TigerOpenClientConfig,
+        TradeClient=TradeClient,
+    )
+
+
+# Threads per worker for blocking SDK calls
+SDK_THREADS = 4
+
+# JSON-compatibility probe for _serialize_response. This stays the stdlib
+# encoder: faster encoders disagree on Enum, UUID, namedtuple and big-int
+# values, which would change what reaches the wire as str().
+_json_probe = json.dumps
+
+# JSON-native values returned unchanged by _serialize_response
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 class TigerWorker:
@@ -41,9 +80,29 @@ class TigerWorker:
     Tiger worker process that handles one specific account.
 
     Loads Tiger SDK credentials at startup and processes API calls
-    from the main process via queue communication.
+    from the main process via pipe communication.
     """
 
+    __slots__ = (
+        "process_id",
+        "account_id",
+        "_account_uuid",
+        "account",
+        "credentials",
+        "_account_number",
+        "_environment",
+        "config",
+        "client",
+        "trade_client",
+        "quote_client",
+        "push_client",
+        "_method_cache",
+        "_executor",
+        "is_initialized",
+        "last_heartbeat",
+        "task_count",
+    )
+
     def __init__(self, process_id: str, account_id: str):
         """
         Initialize Tiger worker.
@@ -54,9 +113,14 @@ class TigerWorker:
         """
         self.process_id = process_id
         self.account_id = account_id
+        self._account_uuid = uuid.UUID(account_id)
         self.account = None
         self.credentials = None
 
+        # Plain copies of account fields, so hot paths skip ORM attribute access
+        self._account_number = None
+        self._environment = None
+
         # Tiger SDK clients
         self.config = None
         self.client = None
@@ -64,6 +128,14 @@ class TigerWorker:
         self.quote_client = None
         self.push_client = None
 
+        # Bound SDK methods by "client.method" name, resolved on first use
+        self._method_cache: Dict[str, Callable[..., Any]] = {}
+
+        # The SDK is blocking; calls run here so the event loop stays free
+        self._executor = ThreadPoolExecutor(
+            max_workers=SDK_THREADS, thread_name_prefix=f"tiger-{process_id[:8]}"
+        )
+
         # State management
         self.is_initialized = False
         self.last_heartbeat = datetime.utcnow()
@@ -92,98 +164,75 @@ class TigerWorker:
 
             self.is_initialized = True
             logger.info(
-                f"Tiger SDK initialized successfully for account {self.account.account_number}"
+                f"Tiger SDK initialized successfully for account {self._account_number}"
             )
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to initialize Tiger SDK: {e}")
-            logger.error(traceback.format_exc())
+            logger.opt(exception=True).error(f"Failed to initialize Tiger SDK: {e}")
             return False
 
-    async def process_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_task(self, task: TaskRequest) -> TaskResponse:
         """
         Process a task request.
 
         Args:
-            task_data: Task request data
+            task: Task request from the pool
 
         Returns:
-            Task response data
+            Task response to send back
         """
-        task_id = task_data.get("task_id")
-        method = task_data.get("method")
-        args = task_data.get("args", [])
-        kwargs = task_data.get("kwargs", {})
+        task_id = task.task_id
+        method = task.method
+        args = task.args
+        kwargs = task.kwargs
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            logger.debug(f"Processing task {task_id}: {method}")
+            # Per-task debug lines use loguru's deferred formatting
+            logger.debug("Processing task {}: {}", task_id, method)
 
             # Check initialization
             if not self.is_initialized:
                 raise RuntimeError("Worker not initialized")
 
             # Route method call
-            if method.startswith("trade."):
-                result = await self._execute_trade_method(method[6:], args, kwargs)
-            elif method.startswith("quote."):
-                result = await self._execute_quote_method(method[6:], args, kwargs)
-            elif method.startswith("push."):
-                result = await self._execute_push_method(method[5:], args, kwargs)
-            elif method == "health_check":
-                result = await self._health_check()
+            if method == "batch":
+                result = await self._execute_batch(*args, **kwargs)
             else:
-                raise ValueError(f"Unknown method: {method}")
+                result = await self._dispatch(method, args, kwargs)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             self.task_count += 1
 
-            logger.debug(f"Task {task_id} completed in {execution_time:.2f}s")
+            logger.debug("Task {} completed in {:.2f}s", task_id, execution_time)
 
-            return {
-                "task_id": task_id,
-                "success": True,
-                "result": result,
-                "execution_time": execution_time,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            return TaskResponse(
+                task_id=task_id,
+                success=True,
+                result=result,
+                execution_time=execution_time,
+            )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
             error_msg = str(e)
 
-            logger.error(f"Task {task_id} failed: {error_msg}")
-            logger.error(traceback.format_exc())
+            logger.opt(exception=True).error(f"Task {task_id} failed: {error_msg}")
 
-            return {
-                "task_id": task_id,
-                "success": False,
-                "error": error_msg,
-                "execution_time": execution_time,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-    async def heartbeat(self) -> Dict[str, Any]:
-        """
-        Respond to heartbeat check.
+            return TaskResponse(
+                task_id=task_id,
+                success=False,
+                error=error_msg,
+                execution_time=execution_time,
+            )
 
-        Returns:
-            Heartbeat response
-        """
+    def heartbeat(self) -> None:
+        """Record a heartbeat check from the main process."""
         self.last_heartbeat = datetime.utcnow()
 
-        return {
-            "type": "heartbeat_response",
-            "process_id": self.process_id,
-            "account_id": self.account_id,
-            "timestamp": self.last_heartbeat.isoformat(),
-            "task_count": self.task_count,
-            "is_initialized": self.is_initialized,
-        }
-
     async def shutdown(self) -> None:
         """Graceful shutdown of the worker."""
         try:
@@ -193,10 +242,11 @@ class TigerWorker:
             if self.push_client:
                 try:
                     self.push_client.disconnect()
-                except:
-                    pass
+                except Exception as e:
+                    logger.warning(f"Failed to disconnect push client: {e}")
 
             # Clean up resources
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.is_initialized = False
 
             logger.info(f"TigerWorker {self.process_id} shutdown complete")
@@ -209,23 +259,16 @@ class TigerWorker:
     async def _load_account_credentials(self) -> None:
         """Load account and decrypt credentials."""
         # Import account manager in worker process
-        sys.path.insert(
-            0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-        )
-        sys.path.insert(
-            0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/database/src"
-        )
-
         from shared.account_manager import get_account_manager
 
         account_manager = get_account_manager()
 
         # Get account by ID
-        self.account = await account_manager.get_account_by_id(
-            uuid.UUID(self.account_id)
-        )
+        self.account = await account_manager.get_account_by_id(self._account_uuid)
         if not self.account:
             raise RuntimeError(f"Account {self.account_id} not found")
+        self._account_number = self.account.account_number
+        self._environment = self.account.environment
 
         # Decrypt credentials
         self.credentials = await account_manager.decrypt_credentials(self.account)
@@ -234,13 +277,13 @@ class TigerWorker:
         ):
             raise RuntimeError("Missing or invalid credentials")
 
-        logger.info(f"Loaded credentials for account {self.account.account_number}")
+        logger.info(f"Loaded credentials for account {self._account_number}")
 
     async def _configure_tiger_sdk(self) -> None:
         """Configure Tiger SDK with account credentials."""
         try:
             # Determine server URL
-            if self.account.environment == "production":
+            if self._environment == "production":
                 server_url = (
                     self.account.server_url or "https://openapi.tigerfintech.com"
                 )
@@ -251,17 +294,15 @@ class TigerWorker:
                 )
 
             # Create Tiger configuration
-            self.config = TigerOpenClientConfig(
+            self.config = _tiger_sdk().TigerOpenClientConfig(
                 tiger_id=self.credentials["tiger_id"],
                 private_key=self.credentials["private_key"],
-                account=self.account.account_number,
+                account=self._account_number,
                 server_url=server_url,
-                env=self.account.environment,
+                env=self._environment,
             )
 
-            logger.info(
-                f"Tiger SDK configured for {self.account.environment} environment"
-            )
+            logger.info(f"Tiger SDK configured for {self._environment} environment")
 
         except Exception as e:
             logger.error(f"Failed to configure Tiger SDK: {e}")
@@ -270,13 +311,20 @@ class TigerWorker:
     async def _initialize_clients(self) -> None:
         """Initialize Tiger SDK clients."""
         try:
+            sdk = _tiger_sdk()
+
             # Create main client
-            self.client = TigerOpenClient(self.config)
+            self.client = sdk.TigerOpenClient(self.config)
 
             # Create specialized clients
-            self.trade_client = TradeClient(self.config)
-            self.quote_client = QuoteClient(self.config)
-            self.push_client = PushClient(self.config)
+            self.trade_client = sdk.TradeClient(self.config)
+            self.quote_client = sdk.QuoteClient(self.config)
+            self.push_client = sdk.PushClient(self.config)
+            self._method_cache.clear()
+
+            # All SDK clients share one urllib3 PoolManager; keep a connection
+            # per executor thread alive instead of discarding the extras
+            sdk.web_utils.http_pool.connection_pool_kw["maxsize"] = SDK_THREADS
 
             logger.info("Tiger SDK clients initialized successfully")
 
@@ -284,85 +332,96 @@ class TigerWorker:
             logger.error(f"Failed to initialize Tiger clients: {e}")
             raise
 
-    async def _execute_trade_method(
+    async def _dispatch(
         self, method: str, args: List[Any], kwargs: Dict[str, Any]
     ) -> Any:
-        """Execute trade client method."""
-        if not self.trade_client:
-            raise RuntimeError("Trade client not initialized")
+        """Route a method call to the matching Tiger client."""
+        if method == "health_check":
+            return await self._health_check()
 
-        if not hasattr(self.trade_client, method):
-            raise AttributeError(f"Trade client has no method '{method}'")
+        bound = self._method_cache.get(method)
+        if bound is None:
+            bound = self._method_cache[method] = self._resolve_method(method)
 
-        # Get method and execute
-        trade_method = getattr(self.trade_client, method)
-        result = trade_method(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._call_sdk, bound, args, kwargs
+        )
 
+    def _call_sdk(
+        self, bound: Callable[..., Any], args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Run a blocking SDK call on an executor thread."""
         # Convert response to serializable format
-        return self._serialize_response(result)
+        return self._serialize_response(bound(*args, **kwargs))
+
+    def _resolve_method(self, method: str) -> Callable[..., Any]:
+        """Look up the bound SDK method for a "client.method" name."""
+        prefix, _, name = method.partition(".")
+        clients = {
+            "trade": self.trade_client,
+            "quote": self.quote_client,
+            "push": self.push_client,
+        }
+        if not name or prefix not in clients:
+            raise ValueError(f"Unknown method: {method}")
 
-    async def _execute_quote_method(
-        self, method: str, args: List[Any], kwargs: Dict[str, Any]
-    ) -> Any:
-        """Execute quote client method."""
-        if not self.quote_client:
-            raise RuntimeError("Quote client not initialized")
+        client = clients[prefix]
+        if not client:
+            raise RuntimeError(f"{prefix.capitalize()} client not initialized")
 
-        if not hasattr(self.quote_client, method):
-            raise AttributeError(f"Quote client has no method '{method}'")
+        # Only public SDK methods are callable from the pool
+        bound = None if name.startswith("_") else getattr(client, name, None)
+        if not callable(bound):
+            raise AttributeError(f"{prefix.capitalize()} client has no method '{name}'")
 
-        # Get method and execute
-        quote_method = getattr(self.quote_client, method)
-        result = quote_method(*args, **kwargs)
+        return bound
 
-        # Convert response to serializable format
-        return self._serialize_response(result)
+    async def _execute_batch(self, calls: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several method calls received in one task.
 
-    async def _execute_push_method(
-        self, method: str, args: List[Any], kwargs: Dict[str, Any]
-    ) -> Any:
-        """Execute push client method."""
-        if not self.push_client:
-            raise RuntimeError("Push client not initialized")
+        Calls run concurrently on the SDK executor; a failing call does not
+        stop the rest of the batch.
 
-        if not hasattr(self.push_client, method):
-            raise AttributeError(f"Push client has no method '{method}'")
+        Args:
+            calls: List of [method, args, kwargs] entries
 
-        # Get method and execute
-        push_method = getattr(self.push_client, method)
-        result = push_method(*args, **kwargs)
+        Returns:
+            One {"success", "result"} or {"success", "error"} entry per call,
+            in the order of calls
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self._dispatch(method, args or [], kwargs or {})
+                for method, args, kwargs in calls
+            ),
+            return_exceptions=True,
+        )
 
-        # Convert response to serializable format
-        return self._serialize_response(result)
+        results = []
+        for (method, _, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Batch call {method} failed: {outcome}")
+                results.append({"success": False, "error": str(outcome)})
+            else:
+                results.append({"success": True, "result": outcome})
+        return results
 
     async def _health_check(self) -> Dict[str, Any]:
         """Perform health check."""
         try:
-            # Test trade client connection
-            trade_health = False
-            if self.trade_client:
-                try:
-                    # Try to get account info
-                    account_info = self.trade_client.get_account()
-                    trade_health = bool(account_info)
-                except:
-                    pass
-
-            # Test quote client connection
-            quote_health = False
-            if self.quote_client:
-                try:
-                    # Try to get market status
-                    market_status = self.quote_client.get_market_status()
-                    quote_health = bool(market_status)
-                except:
-                    pass
+            # Probe trade (account info) and quote (market status) concurrently
+            trade_health, quote_health = await asyncio.gather(
+                self._probe_client("Trade", self.trade_client, "get_account"),
+                self._probe_client("Quote", self.quote_client, "get_market_status"),
+            )
 
             return {
                 "process_id": self.process_id,
                 "account_id": self.account_id,
-                "account_number": self.account.account_number,
-                "environment": self.account.environment,
+                "account_number": self._account_number,
+                "environment": self._environment,
                 "is_initialized": self.is_initialized,
                 "trade_client_healthy": trade_health,
                 "quote_client_healthy": quote_health,
@@ -381,6 +440,19 @@ class TigerWorker:
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
+    async def _probe_client(self, label: str, client: Any, method: str) -> bool:
+        """Call one SDK method on the executor and report whether it answered."""
+        if not client:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+            return bool(
+                await loop.run_in_executor(self._executor, getattr(client, method))
+            )
+        except Exception as e:
+            logger.warning(f"{label} client health check failed: {e}")
+            return False
+
     def _serialize_response(self, response) -> Any:
         """
         Serialize Tiger API response to JSON-compatible format.
@@ -391,19 +463,33 @@ class TigerWorker:
         Returns:
             Serializable representation
         """
+        # Built-in values need no reflection
+        response_type = type(response)
+        if response_type in _PRIMITIVE_TYPES:
+            return response
+        if response_type is list or response_type is tuple:
+            return [self._serialize_response(item) for item in response]
+        if response_type is dict:
+            return {k: self._serialize_response(v) for k, v in response.items()}
+
         try:
             # Handle different response types
             if hasattr(response, "to_dict"):
                 return response.to_dict()
             elif hasattr(response, "__dict__"):
                 # Convert object attributes to dict
-                result = {}
-                for key, value in response.__dict__.items():
-                    if not key.startswith("_"):
+                result = {
+                    key: value
+                    for key, value in response.__dict__.items()
+                    if not key.startswith("_")
+                }
+                try:
+                    # Probe the whole object once; only fall back per field
+                    _json_probe(result)
+                except (TypeError, ValueError):
+                    for key, value in result.items():
                         try:
-                            # Try to serialize the value
-                            json.dumps(value)
-                            result[key] = value
+                            _json_probe(value)
                         except (TypeError, ValueError):
                             # Convert non-serializable values to string
                             result[key] = str(value)
@@ -415,7 +501,7 @@ class TigerWorker:
             else:
                 # Try direct serialization
                 try:
-                    json.dumps(response)
+                    _json_probe(response)
                     return response
                 except (TypeError, ValueError):
                     return str(response)
@@ -426,7 +512,12 @@ class TigerWorker:
 
 
 def tiger_worker_main(
-    process_id: str, account_id: str, task_queue: mp.Queue, result_queue: mp.Queue
+    process_id: str,
+    account_id: str,
+    task_conn: Connection,
+    result_conn: Connection,
+    heartbeat_ns: Any,
+    slot: int,
 ) -> None:
     """
     Main entry point for Tiger worker process.
@@ -434,8 +525,10 @@ def tiger_worker_main(
     Args:
         process_id: Unique process identifier
         account_id: Tiger account ID
-        task_queue: Queue for receiving tasks
-        result_queue: Queue for sending results
+        task_conn: Pipe end for receiving tasks
+        result_conn: Pipe end for sending results
+        heartbeat_ns: Shared heartbeat array the main process monitors
+        slot: This worker's slot in heartbeat_ns
     """
     # Set up process-specific logging
     logger.remove()  # Remove default handler
@@ -449,14 +542,13 @@ def tiger_worker_main(
     logger.info(f"Starting Tiger worker process {process_id} for account {account_id}")
 
     worker = None
+    heartbeat_index = slot * HEARTBEAT_STRIDE
 
     try:
         # Create worker instance
         worker = TigerWorker(process_id, account_id)
 
         # Initialize worker (this is synchronous in the worker process)
-        import asyncio
-
         async def async_main():
             # Initialize worker
             if not await worker.initialize():
@@ -464,67 +556,90 @@ def tiger_worker_main(
                 return
 
             # Send ready signal
+            heartbeat_ns[heartbeat_index] = time.monotonic_ns()
             ready_msg = {
                 "type": "ready",
                 "process_id": process_id,
                 "account_id": account_id,
                 "timestamp": datetime.utcnow().isoformat(),
             }
-            result_queue.put(ready_msg)
+            result_conn.send(ready_msg)
 
             logger.info(f"Worker {process_id} ready and waiting for tasks")
 
-            # Main processing loop
-            while True:
+            loop = asyncio.get_running_loop()
+            stopped = asyncio.Event()
+            running = set()
+            outbox: List[TaskResponse] = []
+
+            def flush_results() -> None:
+                # One send for every response finished in this loop pass
+                batch = outbox.copy()
+                outbox.clear()
+                result_conn.send(batch[0] if len(batch) == 1 else batch)
+
+            async def run_task(task: TaskRequest) -> None:
+                response = await worker.process_task(task)
+                heartbeat_ns[heartbeat_index] = time.monotonic_ns()
+                outbox.append(response)
+                if len(outbox) == 1:
+                    loop.call_soon(flush_results)
+
+            def on_task_ready() -> None:
+                # Drain every frame already in the pipe; tasks run concurrently
                 try:
-                    # Get task from queue (with timeout)
-                    try:
-                        task_data = task_queue.get(timeout=1.0)
-                    except:
-                        # No task, continue loop
-                        continue
-
-                    # Handle special messages
-                    if isinstance(task_data, dict):
-                        msg_type = task_data.get("type")
-
-                        if msg_type == "shutdown":
+                    while task_conn.poll():
+                        data = task_conn.recv_bytes()
+
+                        # Handle control frames
+                        if data[0] == TAG_SHUTDOWN:
                             logger.info("Received shutdown signal")
-                            await worker.shutdown()
-                            break
+                            stopped.set()
+                            return
 
-                        elif msg_type == "heartbeat":
-                            heartbeat_response = await worker.heartbeat()
-                            result_queue.put(heartbeat_response)
+                        if data[0] == TAG_HEARTBEAT:
+                            worker.heartbeat()
+                            heartbeat_ns[heartbeat_index] = time.monotonic_ns()
                             continue
 
-                    # Process regular task
-                    if isinstance(task_data, dict) and "task_id" in task_data:
-                        response = await worker.process_task(task_data)
-                        result_queue.put(response)
-                    else:
-                        logger.warning(f"Invalid task data: {task_data}")
-
-                except KeyboardInterrupt:
-                    logger.info("Received interrupt signal")
-                    break
+                        # Process regular task
+                        task_data = pickle.loads(data)
+                        if isinstance(task_data, TaskRequest):
+                            handle = loop.create_task(run_task(task_data))
+                            running.add(handle)
+                            handle.add_done_callback(running.discard)
+                        else:
+                            logger.warning(f"Invalid task data: {task_data}")
+
+                except (EOFError, OSError):
+                    logger.info("Task pipe closed by parent process")
+                    stopped.set()
                 except Exception as e:
-                    logger.error(f"Error in main loop: {e}")
-                    logger.error(traceback.format_exc())
+                    logger.opt(exception=True).error(f"Error in main loop: {e}")
+
+            loop.add_reader(task_conn.fileno(), on_task_ready)
+            try:
+                await stopped.wait()
+            finally:
+                loop.remove_reader(task_conn.fileno())
+
+            await worker.shutdown()
 
         # Run async main
-        asyncio.run(async_main())
+        try:
+            asyncio.run(async_main())
+        except KeyboardInterrupt:
+            logger.info("Received interrupt signal")
 
     except Exception as e:
-        logger.error(f"Fatal error in worker process: {e}")
-        logger.error(traceback.format_exc())
+        logger.opt(exception=True).error(f"Fatal error in worker process: {e}")
 
     finally:
         if worker:
             try:
                 asyncio.run(worker.shutdown())
-            except:
-                pass
+            except Exception as e:
+                logger.error(f"Error during worker shutdown: {e}")
 
         logger.info(f"Tiger worker process {process_id} exiting")
 
@@ -535,11 +650,15 @@ if __name__ == "__main__":
         process_id = sys.argv[1]
         account_id = sys.argv[2]
 
-        # Create dummy queues for testing
-        task_queue = mp.Queue()
-        result_queue = mp.Queue()
+        # Create dummy pipes for testing; keep the other ends open so the
+        # worker does not see EOF
+        task_conn, task_sender = mp.Pipe(duplex=False)
+        result_receiver, result_conn = mp.Pipe(duplex=False)
+        heartbeat_ns = mp.RawArray("q", HEARTBEAT_STRIDE)
 
-        tiger_worker_main(process_id, account_id, task_queue, result_queue)
+        tiger_worker_main(
+            process_id, account_id, task_conn, result_conn, heartbeat_ns, 0
+        )
     else:
         print("Usage: python tiger_worker.py <process_id> <account_id>")
         sys.exit(1)
@@ -5,15 +5,14 @@ Provides MCP tools for managing Tiger accounts, including listing, adding,
 removing accounts, and handling account status and default account settings.
 """
 
-import sys
+import asyncio
+import functools
+import operator
+import secrets
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-# Add paths for imports
-sys.path.insert(
-    0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-)
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
 from loguru import logger
@@ -34,6 +33,70 @@ from ..process_manager import get_process_manager
 # Initialize FastMCP instance for account tools
 mcp = FastMCP("Tiger Account Tools")
 
+# Case-insensitive lookups for the string parameters of the tools
+_ACCOUNT_TYPES = {member.value: member for member in AccountType}
+_ACCOUNT_STATUSES = {member.value: member for member in AccountStatus}
+_MARKET_PERMISSIONS = {member.value: member for member in MarketPermission}
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """Format a Unix second as a UTC ISO timestamp."""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+# Account attributes read by AccountToolsService._format_account, in order
+_ACCOUNT_FIELDS = operator.attrgetter(
+    "id",
+    "account_name",
+    "account_number",
+    "account_type",
+    "environment",
+    "status",
+    "is_default_trading",
+    "is_default_data",
+    "error_count",
+    "last_error",
+    "market_permissions",
+    "has_valid_token",
+    "needs_token_refresh",
+    "token_expires_at",
+    "created_at",
+    "updated_at",
+    "description",
+    "tags",
+)
+
+
+def _parse_account_id(account_id: str) -> Optional[uuid.UUID]:
+    """Parse an account ID, returning None if it is not a valid UUID."""
+    try:
+        return uuid.UUID(account_id)
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _validate_add_account(
+    name: str, api_key: str, secret_key: str, account_type: str, environment: str
+) -> Optional[str]:
+    """Check tiger_add_account inputs, returning the first error or None."""
+    if not name or not name.strip():
+        return "Account name is required"
+    if not api_key or not api_key.strip():
+        return "API key is required"
+    if not secret_key or not secret_key.strip():
+        return "Secret key is required"
+    if account_type.lower() not in _ACCOUNT_TYPES:
+        return f"Invalid account_type '{account_type}'. Must be: standard, paper, prime"
+    if environment not in ("sandbox", "production"):
+        return "Environment must be 'sandbox' or 'production'"
+    return None
+
+
+def _response_timestamp() -> str:
+    """Response timestamp, formatted once per second."""
+    return _iso_second(int(time.time()))
+
 
 class AccountListResponse(BaseModel):
     """Account list response model."""
@@ -42,7 +105,7 @@ class AccountListResponse(BaseModel):
     accounts: List[Dict[str, Any]] = Field(default_factory=list)
     total_count: int = 0
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
 
 
 class AccountResponse(BaseModel):
@@ -51,7 +114,12 @@ class AccountResponse(BaseModel):
     success: bool
     account: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
+
+
+def _account_error(error: str) -> AccountResponse:
+    """Build a failed AccountResponse without re-validating known-good fields."""
+    return AccountResponse.model_construct(success=False, error=error)
 
 
 class AccountStatusResponse(BaseModel):
@@ -61,7 +129,7 @@ class AccountStatusResponse(BaseModel):
     account_id: str = ""
     status: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
 
 
 class TokenRefreshResponse(BaseModel):
@@ -72,17 +140,45 @@ class TokenRefreshResponse(BaseModel):
     token_refreshed: bool = False
     token_expires_at: Optional[str] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
 
 
 # Service instance for account management
 class AccountToolsService:
     """Service class for account management tools."""
 
-    def __init__(self):
-        self.process_manager = get_process_manager()
-        self.account_manager = get_account_manager()
-        self.account_router = get_account_router()
+    def __init__(self, list_cache_ttl: float = 2.0, list_cache_size: int = 256):
+        """
+        Initialize account tools service.
+
+        Args:
+            list_cache_ttl: Seconds a formatted account listing stays valid
+            list_cache_size: Most filter combinations whose listings are kept
+        """
+        # Formatted listings by filter tuple: (monotonic time, accounts)
+        self.list_cache_ttl = list_cache_ttl
+        self.list_cache_size = list_cache_size
+        self._list_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+
+    # Singletons are resolved on first use so importing the tools module
+    # does not build managers a process never touches
+    @functools.cached_property
+    def process_manager(self):
+        """Process manager, resolved on first access."""
+        return get_process_manager()
+
+    @functools.cached_property
+    def account_manager(self):
+        """Account manager, resolved on first access."""
+        account_manager = get_account_manager()
+        # Cached listings go stale whenever the manager commits an account change
+        account_manager.add_change_listener(self.invalidate_account_listings)
+        return account_manager
+
+    @functools.cached_property
+    def account_router(self):
+        """Account router, resolved on first access."""
+        return get_account_router()
 
     async def ensure_started(self):
         """Ensure the process manager is started."""
@@ -92,33 +188,86 @@ class AccountToolsService:
         ):
             await self.process_manager.start()
 
+    async def list_formatted_accounts(
+        self,
+        account_type: Optional[AccountType],
+        status: Optional[AccountStatus],
+        environment: Optional[str],
+        include_inactive: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return formatted accounts for a filter, reusing recent listings.
+
+        Dashboards poll the same filters every few seconds; results younger
+        than ``list_cache_ttl`` skip both the query and the formatting.
+        """
+        key = (account_type, status, environment, include_inactive)
+        cached = self._list_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.list_cache_ttl:
+            return cached[1]
+
+        accounts = await self.account_manager.list_accounts(
+            account_type=account_type,
+            status=status,
+            environment=environment,
+            include_inactive=include_inactive,
+            load_relationships=False,  # _format_account reads columns only
+        )
+        formatted_accounts = [self._format_account(account) for account in accounts]
+        # Oldest filter first out once the cache is full
+        self._list_cache.pop(key, None)
+        self._list_cache[key] = (time.monotonic(), formatted_accounts)
+        if len(self._list_cache) > self.list_cache_size:
+            del self._list_cache[next(iter(self._list_cache))]
+        return formatted_accounts
+
+    def invalidate_account_listings(self) -> None:
+        """Drop cached listings; the account manager calls this on every change."""
+        self._list_cache.clear()
+
     def _format_account(self, account) -> Dict[str, Any]:
         """Format account for API response."""
+        (
+            account_id,
+            account_name,
+            account_number,
+            account_type,
+            environment,
+            status,
+            is_default_trading,
+            is_default_data,
+            error_count,
+            last_error,
+            market_permissions,
+            has_valid_token,
+            needs_token_refresh,
+            token_expires_at,
+            created_at,
+            updated_at,
+            description,
+            tags,
+        ) = _ACCOUNT_FIELDS(account)
         return {
-            "id": str(account.id),
-            "account_name": account.account_name,
-            "account_number": account.account_number,
-            "account_type": account.account_type.value,
-            "environment": account.environment,
-            "status": account.status.value,
-            "is_default_trading": account.is_default_trading,
-            "is_default_data": account.is_default_data,
-            "error_count": account.error_count,
-            "last_error": account.last_error,
-            "market_permissions": account.market_permissions.get("permissions", []),
-            "has_valid_token": account.has_valid_token,
-            "needs_token_refresh": account.needs_token_refresh,
+            "id": str(account_id),
+            "account_name": account_name,
+            "account_number": account_number,
+            "account_type": account_type.value,
+            "environment": environment,
+            "status": status.value,
+            "is_default_trading": is_default_trading,
+            "is_default_data": is_default_data,
+            "error_count": error_count,
+            "last_error": last_error,
+            "market_permissions": market_permissions.get("permissions", []),
+            "has_valid_token": has_valid_token,
+            "needs_token_refresh": needs_token_refresh,
             "token_expires_at": (
-                account.token_expires_at.isoformat()
-                if account.token_expires_at
-                else None
+                token_expires_at.isoformat() if token_expires_at else None
             ),
-            "created_at": account.created_at.isoformat(),
-            "updated_at": (
-                account.updated_at.isoformat() if account.updated_at else None
-            ),
-            "description": account.description,
-            "tags": account.tags or {},
+            "created_at": created_at.isoformat(),
+            "updated_at": updated_at.isoformat() if updated_at else None,
+            "description": description,
+            "tags": tags or {},
         }
 
 
@@ -175,9 +324,8 @@ async def tiger_list_accounts(
         # Convert string parameters to enum types
         account_type_enum = None
         if account_type:
-            try:
-                account_type_enum = AccountType(account_type.upper())
-            except ValueError:
+            account_type_enum = _ACCOUNT_TYPES.get(account_type.lower())
+            if account_type_enum is None:
                 return AccountListResponse(
                     success=False,
                     error=f"Invalid account_type '{account_type}'. Must be: standard, paper, prime",
@@ -185,27 +333,21 @@ async def tiger_list_accounts(
 
         status_enum = None
         if status:
-            try:
-                status_enum = AccountStatus(status.upper())
-            except ValueError:
+            status_enum = _ACCOUNT_STATUSES.get(status.lower())
+            if status_enum is None:
                 return AccountListResponse(
                     success=False,
                     error=f"Invalid status '{status}'. Must be: active, inactive, suspended, error",
                 )
 
-        # Get accounts from manager
-        accounts = await _account_service.account_manager.list_accounts(
+        # Get formatted accounts from manager (briefly cached for polling)
+        formatted_accounts = await _account_service.list_formatted_accounts(
             account_type=account_type_enum,
             status=status_enum,
             environment=environment,
             include_inactive=include_inactive,
         )
 
-        # Format accounts for response
-        formatted_accounts = [
-            _account_service._format_account(account) for account in accounts
-        ]
-
         return AccountListResponse(
             success=True,
             accounts=formatted_accounts,
@@ -213,7 +355,7 @@ async def tiger_list_accounts(
         )
 
     except Exception as e:
-        logger.error(f"Failed to list accounts: {e}")
+        logger.error("Failed to list accounts: {}", e)
         return AccountListResponse(success=False, error=str(e))
 
 
@@ -278,48 +420,31 @@ async def tiger_add_account(
         ```
     """
     try:
-        # Validate inputs
-        if not name or not name.strip():
-            return AccountResponse(success=False, error="Account name is required")
-
-        if not api_key or not api_key.strip():
-            return AccountResponse(success=False, error="API key is required")
-
-        if not secret_key or not secret_key.strip():
-            return AccountResponse(success=False, error="Secret key is required")
-
-        # Convert account type
-        try:
-            account_type_enum = AccountType(account_type.upper())
-        except ValueError:
-            return AccountResponse(
-                success=False,
-                error=f"Invalid account_type '{account_type}'. Must be: standard, paper, prime",
-            )
-
         # Determine environment if not specified
         if environment is None:
             environment = "sandbox" if is_paper else "production"
 
-        # Validate environment
-        if environment not in ["sandbox", "production"]:
-            return AccountResponse(
-                success=False, error="Environment must be 'sandbox' or 'production'"
-            )
+        # Validate inputs
+        error = _validate_add_account(
+            name, api_key, secret_key, account_type, environment
+        )
+        if error:
+            return _account_error(error)
+
+        account_type_enum = _ACCOUNT_TYPES[account_type.lower()]
 
         # Convert market permissions
         market_permission_enums = []
         if market_permissions:
             for permission in market_permissions:
-                try:
-                    # Assume permission strings map to MarketPermission enum
-                    # This may need adjustment based on actual MarketPermission definition
-                    market_permission_enums.append(MarketPermission(permission))
-                except ValueError:
-                    logger.warning(f"Invalid market permission: {permission}")
+                permission_enum = _MARKET_PERMISSIONS.get(permission.lower())
+                if permission_enum is None:
+                    logger.warning("Invalid market permission: {}", permission)
+                else:
+                    market_permission_enums.append(permission_enum)
 
         # Generate account number (this might need to be provided or generated differently)
-        account_number = f"TG{uuid.uuid4().hex[:8].upper()}"
+        account_number = f"TG{secrets.token_hex(4).upper()}"
 
         # Create account using account manager
         account = await _account_service.account_manager.create_account(
@@ -336,23 +461,21 @@ async def tiger_add_account(
             server_url=server_url,
         )
 
-        logger.info(f"Successfully added Tiger account: {name} ({account_number})")
+        logger.info("Successfully added Tiger account: {} ({})", name, account_number)
 
         return AccountResponse(
             success=True, account=_account_service._format_account(account)
         )
 
     except AccountValidationError as e:
-        logger.error(f"Account validation failed: {e}")
-        return AccountResponse(success=False, error=f"Validation error: {str(e)}")
+        logger.error("Account validation failed: {}", e)
+        return _account_error(f"Validation error: {str(e)}")
     except AccountManagerError as e:
-        logger.error(f"Account management error: {e}")
-        return AccountResponse(
-            success=False, error=f"Account management error: {str(e)}"
-        )
+        logger.error("Account management error: {}", e)
+        return _account_error(f"Account management error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to add account: {e}")
-        return AccountResponse(success=False, error=f"Failed to add account: {str(e)}")
+        logger.error("Failed to add account: {}", e)
+        return _account_error(f"Failed to add account: {str(e)}")
 
 
 @mcp.tool()
@@ -392,17 +515,14 @@ async def tiger_remove_account(account_id: str, force: bool = False) -> AccountR
     """
     try:
         # Validate account ID format
-        try:
-            account_uuid = uuid.UUID(account_id)
-        except ValueError:
-            return AccountResponse(success=False, error="Invalid account ID format")
+        account_uuid = _parse_account_id(account_id)
+        if account_uuid is None:
+            return _account_error("Invalid account ID format")
 
         # Get account before deletion for response
         account = await _account_service.account_manager.get_account_by_id(account_uuid)
         if not account:
-            return AccountResponse(
-                success=False, error=f"Account {account_id} not found"
-            )
+            return _account_error(f"Account {account_id} not found")
 
         # Store account info for response
         account_info = _account_service._format_account(account)
@@ -414,24 +534,26 @@ async def tiger_remove_account(account_id: str, force: bool = False) -> AccountR
 
         if success:
             logger.info(
-                f"Successfully removed account: {account.account_name} ({account_id})"
+                "Successfully removed account: {} ({})",
+                account.account_name,
+                account_id,
             )
             return AccountResponse(success=True, account=account_info)
         else:
-            return AccountResponse(success=False, error="Failed to remove account")
+            return _account_error("Failed to remove account")
 
     except AccountNotFoundError as e:
-        logger.error(f"Account not found: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account not found: {}", e)
+        return _account_error(str(e))
     except AccountValidationError as e:
-        logger.error(f"Account validation error: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account validation error: {}", e)
+        return _account_error(str(e))
     except AccountManagerError as e:
-        logger.error(f"Account management error: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account management error: {}", e)
+        return _account_error(str(e))
     except Exception as e:
-        logger.error(f"Failed to remove account: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Failed to remove account: {}", e)
+        return _account_error(str(e))
 
 
 @mcp.tool()
@@ -466,9 +588,8 @@ async def tiger_get_account_status(account_id: str) -> AccountStatusResponse:
     """
     try:
         # Validate account ID format
-        try:
-            account_uuid = uuid.UUID(account_id)
-        except ValueError:
+        account_uuid = _parse_account_id(account_id)
+        if account_uuid is None:
             return AccountStatusResponse(
                 success=False, account_id=account_id, error="Invalid account ID format"
             )
@@ -482,37 +603,35 @@ async def tiger_get_account_status(account_id: str) -> AccountStatusResponse:
                 error=f"Account {account_id} not found",
             )
 
-        # Get comprehensive status from account router
-        routing_status = (
-            await _account_service.account_router.check_account_availability(account)
+        # Routing and process status are independent; fetch them together
+        routing_status, process_info = await asyncio.gather(
+            _account_service.account_router.check_account_availability(account),
+            _account_service.process_manager.get_account_process_status(account_id),
+            return_exceptions=True,
         )
+        if isinstance(routing_status, Exception):
+            raise routing_status
 
-        # Get process status if available
+        # Process status is optional
         process_status = None
-        try:
-            process_info = (
-                await _account_service.process_manager.get_account_process_status(
-                    account_id
-                )
-            )
-            if process_info:
-                process_status = {
-                    "process_id": process_info.process_id,
-                    "status": process_info.status.value,
-                    "created_at": (
-                        process_info.created_at.isoformat()
-                        if process_info.created_at
-                        else None
-                    ),
-                    "last_heartbeat": (
-                        process_info.last_heartbeat.isoformat()
-                        if process_info.last_heartbeat
-                        else None
-                    ),
-                    "current_task": process_info.current_task,
-                }
-        except Exception as e:
-            logger.debug(f"Could not get process status: {e}")
+        if isinstance(process_info, Exception):
+            logger.debug("Could not get process status: {}", process_info)
+        elif process_info:
+            process_status = {
+                "process_id": process_info.process_id,
+                "status": process_info.status.value,
+                "created_at": (
+                    process_info.created_at.isoformat()
+                    if process_info.created_at
+                    else None
+                ),
+                "last_heartbeat": (
+                    process_info.last_heartbeat.isoformat()
+                    if process_info.last_heartbeat
+                    else None
+                ),
+                "current_task": process_info.current_task,
+            }
 
         # Build comprehensive status
         status = {
@@ -542,7 +661,7 @@ async def tiger_get_account_status(account_id: str) -> AccountStatusResponse:
         return AccountStatusResponse(success=True, account_id=account_id, status=status)
 
     except Exception as e:
-        logger.error(f"Failed to get account status for {account_id}: {e}")
+        logger.error("Failed to get account status for {}: {}", account_id, e)
         return AccountStatusResponse(success=False, account_id=account_id, error=str(e))
 
 
@@ -574,23 +693,14 @@ async def tiger_refresh_token(account_id: str) -> TokenRefreshResponse:
     """
     try:
         # Validate account ID format
-        try:
-            account_uuid = uuid.UUID(account_id)
-        except ValueError:
+        account_uuid = _parse_account_id(account_id)
+        if account_uuid is None:
             return TokenRefreshResponse(
                 success=False, account_id=account_id, error="Invalid account ID format"
             )
 
-        # Get account
-        account = await _account_service.account_manager.get_account_by_id(account_uuid)
-        if not account:
-            return TokenRefreshResponse(
-                success=False,
-                account_id=account_id,
-                error=f"Account {account_id} not found",
-            )
-
-        # Perform manual token refresh through process manager
+        # Perform manual token refresh through process manager; it validates
+        # the account first and reports a missing one as the error
         # This may need adjustment based on actual token refresh implementation
         try:
             health_check = await _account_service.process_manager.health_check_account(
@@ -598,6 +708,8 @@ async def tiger_refresh_token(account_id: str) -> TokenRefreshResponse:
             )
 
             if health_check.get("healthy", False):
+                _account_service.invalidate_account_listings()
+
                 # Token refresh successful
                 # Get updated account to check token expiration
                 updated_account = (
@@ -612,7 +724,7 @@ async def tiger_refresh_token(account_id: str) -> TokenRefreshResponse:
                     token_refreshed=True,
                     token_expires_at=(
                         updated_account.token_expires_at.isoformat()
-                        if updated_account.token_expires_at
+                        if updated_account and updated_account.token_expires_at
                         else None
                     ),
                 )
@@ -625,7 +737,7 @@ async def tiger_refresh_token(account_id: str) -> TokenRefreshResponse:
                 )
 
         except Exception as e:
-            logger.error(f"Token refresh failed for account {account_id}: {e}")
+            logger.error("Token refresh failed for account {}: {}", account_id, e)
             return TokenRefreshResponse(
                 success=False,
                 account_id=account_id,
@@ -634,7 +746,7 @@ async def tiger_refresh_token(account_id: str) -> TokenRefreshResponse:
             )
 
     except Exception as e:
-        logger.error(f"Failed to refresh token for {account_id}: {e}")
+        logger.error("Failed to refresh token for {}: {}", account_id, e)
         return TokenRefreshResponse(
             success=False, account_id=account_id, token_refreshed=False, error=str(e)
         )
@@ -664,31 +776,30 @@ async def tiger_set_default_data_account(account_id: str) -> AccountResponse:
     """
     try:
         # Validate account ID format
-        try:
-            account_uuid = uuid.UUID(account_id)
-        except ValueError:
-            return AccountResponse(success=False, error="Invalid account ID format")
+        account_uuid = _parse_account_id(account_id)
+        if account_uuid is None:
+            return _account_error("Invalid account ID format")
 
         # Set as default data account
         account = await _account_service.account_manager.set_default_data_account(
             account_uuid
         )
 
-        logger.info(f"Set account {account.account_name} as default data account")
+        logger.info("Set account {} as default data account", account.account_name)
 
         return AccountResponse(
             success=True, account=_account_service._format_account(account)
         )
 
     except AccountNotFoundError as e:
-        logger.error(f"Account not found: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account not found: {}", e)
+        return _account_error(str(e))
     except AccountManagerError as e:
-        logger.error(f"Account management error: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account management error: {}", e)
+        return _account_error(str(e))
     except Exception as e:
-        logger.error(f"Failed to set default data account: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Failed to set default data account: {}", e)
+        return _account_error(str(e))
 
 
 @mcp.tool()
@@ -720,28 +831,27 @@ async def tiger_set_default_trading_account(account_id: str) -> AccountResponse:
     """
     try:
         # Validate account ID format
-        try:
-            account_uuid = uuid.UUID(account_id)
-        except ValueError:
-            return AccountResponse(success=False, error="Invalid account ID format")
+        account_uuid = _parse_account_id(account_id)
+        if account_uuid is None:
+            return _account_error("Invalid account ID format")
 
         # Set as default trading account
         account = await _account_service.account_manager.set_default_trading_account(
             account_uuid
         )
 
-        logger.info(f"Set account {account.account_name} as default trading account")
+        logger.info("Set account {} as default trading account", account.account_name)
 
         return AccountResponse(
             success=True, account=_account_service._format_account(account)
         )
 
     except AccountNotFoundError as e:
-        logger.error(f"Account not found: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account not found: {}", e)
+        return _account_error(str(e))
     except AccountManagerError as e:
-        logger.error(f"Account management error: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Account management error: {}", e)
+        return _account_error(str(e))
     except Exception as e:
-        logger.error(f"Failed to set default trading account: {e}")
-        return AccountResponse(success=False, error=str(e))
+        logger.error("Failed to set default trading account: {}", e)
+        return _account_error(str(e))
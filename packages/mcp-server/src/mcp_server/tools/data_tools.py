@@ -5,14 +5,13 @@ Provides MCP tools for retrieving market data, quotes, historical data,
 and other market-related information through the Tiger API process pool.
 """
 
-import sys
+import asyncio
+import functools
+import itertools
+import operator
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-# Add paths for imports
-sys.path.insert(
-    0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-)
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from fastmcp import FastMCP
 from loguru import logger
@@ -25,6 +24,113 @@ from ..process_manager import get_process_manager
 # Initialize FastMCP instance for data tools
 mcp = FastMCP("Tiger Data Tools")
 
+# Most symbols sent to one get_stock_briefs call
+MAX_BATCH_SYMBOLS = 50
+
+# SDK attributes read into tool responses, with the value used when missing
+_QUOTE_FIELDS: Dict[str, Any] = {
+    "symbol": "",
+    "latest_price": 0,
+    "bid_price": 0,
+    "ask_price": 0,
+    "bid_size": 0,
+    "ask_size": 0,
+    "volume": 0,
+    "prev_close": 0,
+    "open": 0,
+    "high": 0,
+    "low": 0,
+    "change": 0,
+    "change_rate": 0,
+    "latest_time": None,
+}
+_BRIEF_FIELDS: Dict[str, Any] = {
+    name: default
+    for name, default in _QUOTE_FIELDS.items()
+    if name not in ("bid_size", "ask_size")
+}
+_BAR_FIELDS: Dict[str, Any] = {
+    "time": None,
+    "open": 0,
+    "high": 0,
+    "low": 0,
+    "close": 0,
+    "volume": 0,
+}
+_SYMBOL_FIELDS: Dict[str, Any] = {
+    "symbol": "",
+    "name": "",
+    "market": "",
+    "sec_type": "STK",
+    "currency": "USD",
+    "exchange": "",
+    "exp_date": None,
+}
+_OPTION_FIELDS: Dict[str, Any] = {
+    "symbol": "",
+    "strike": 0,
+    "expiry": None,
+    "bid": 0,
+    "ask": 0,
+    "last_price": 0,
+    "volume": 0,
+    "open_interest": 0,
+    "implied_volatility": 0,
+}
+_MARKET_STATUS_FIELDS: Dict[str, Any] = {
+    "status": "UNKNOWN",
+    "trading_date": None,
+    "open_time": None,
+    "close_time": None,
+    "timezone": "UTC",
+    "is_trading_day": False,
+    "pre_market_open": None,
+    "post_market_close": None,
+    "next_trading_day": None,
+}
+
+_QUOTE_GET = operator.attrgetter(*_QUOTE_FIELDS)
+_BRIEF_GET = operator.attrgetter(*_BRIEF_FIELDS)
+_BAR_GET = operator.attrgetter(*_BAR_FIELDS)
+_SYMBOL_GET = operator.attrgetter(*_SYMBOL_FIELDS)
+_OPTION_GET = operator.attrgetter(*_OPTION_FIELDS)
+_MARKET_STATUS_GET = operator.attrgetter(*_MARKET_STATUS_FIELDS)
+
+
+def _fields_getter(names: Iterable[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build an attrgetter that returns a tuple even for a single name."""
+    names = tuple(names)
+    getter = operator.attrgetter(*names)
+    if len(names) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
+
+
+def _read_fields(
+    obj: Any, getter: Callable[[Any], Tuple[Any, ...]], defaults: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Read SDK object attributes into a dict keyed like ``defaults``.
+
+    ``getter`` must fetch the keys of ``defaults`` in order; attributes the
+    object lacks fall back to their default.
+    """
+    try:
+        return dict(zip(defaults, getter(obj)))
+    except AttributeError:
+        return {name: getattr(obj, name, default) for name, default in defaults.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_millisecond(millisecond: int) -> str:
+    """Format a Unix millisecond as a naive UTC ISO timestamp."""
+    return datetime.utcfromtimestamp(millisecond / 1000).isoformat()
+
+
+def _response_timestamp() -> str:
+    """Response timestamp, formatted at most once per millisecond."""
+    return _iso_millisecond(time.time_ns() // 1_000_000)
+
 
 class QuoteResponse(BaseModel):
     """Quote response model."""
@@ -33,7 +139,7 @@ class QuoteResponse(BaseModel):
     symbol: str = ""
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
@@ -46,7 +152,7 @@ class KlineResponse(BaseModel):
     count: int = 0
     data: Optional[List[Dict[str, Any]]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
@@ -58,7 +164,7 @@ class MarketDataResponse(BaseModel):
     fields: List[str] = Field(default_factory=list)
     data: Optional[Dict[str, Dict[str, Any]]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
@@ -70,7 +176,7 @@ class SymbolSearchResponse(BaseModel):
     market: str = ""
     data: Optional[List[Dict[str, Any]]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
@@ -81,7 +187,7 @@ class OptionChainResponse(BaseModel):
     symbol: str = ""
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
@@ -92,18 +198,159 @@ class MarketStatusResponse(BaseModel):
     market: str = ""
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_response_timestamp)
     account_id: Optional[str] = None
 
 
+class _QuoteCoalescer:
+    """
+    Coalesce concurrent single-symbol quote requests per account.
+
+    Requests for one account that arrive within ``window`` seconds of each
+    other are answered by a single briefs call instead of one call each, split
+    into chunks of at most MAX_BATCH_SYMBOLS. Symbols are matched
+    case-insensitively.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, List[str]], Awaitable[Any]],
+        window: float = 0.005,
+    ):
+        """
+        Initialize quote coalescer.
+
+        Args:
+            fetch: Coroutine function fetching briefs for (account_id, symbols)
+            window: Seconds to collect requests before flushing a batch
+        """
+        self._fetch = fetch
+        self.window = window
+        self._pending: Dict[str, Dict[str, asyncio.Future]] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def get(self, account_id: str, symbol: str) -> Any:
+        """Return the brief for a symbol, or None if none came back."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(account_id)
+        if pending is None:
+            pending = self._pending[account_id] = {}
+            loop.call_later(self.window, self._start_flush, account_id)
+
+        key = symbol.upper()
+        future = pending.get(key)
+        if future is None:
+            future = pending[key] = loop.create_future()
+
+        # Shielded so one cancelled caller does not cancel the shared future
+        return await asyncio.shield(future)
+
+    def _start_flush(self, account_id: str) -> None:
+        """Hand the batch collected for an account to a flush task."""
+        pending = self._pending.pop(account_id, None)
+        if not pending:
+            return
+        items = list(pending.items())
+        for start in range(0, len(items), MAX_BATCH_SYMBOLS):
+            chunk = dict(items[start : start + MAX_BATCH_SYMBOLS])
+            task = asyncio.ensure_future(self._flush(account_id, chunk))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, account_id: str, pending: Dict[str, asyncio.Future]):
+        """Fetch one batch of briefs and resolve every waiting request."""
+        try:
+            briefs = await self._fetch(account_id, list(pending)) or ()
+            by_symbol = {
+                str(getattr(brief, "symbol", "")).upper(): brief for brief in briefs
+            }
+            for symbol, future in pending.items():
+                if not future.done():
+                    future.set_result(by_symbol.get(symbol))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Reached with futures unresolved only if the flush was cancelled
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("Quote batch was cancelled before it completed")
+                    )
+
+
 # Service instance for account routing
 class DataToolsService:
     """Service class for data tools with account routing."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        route_cache_ttl: float = 30.0,
+        status_cache_ttl: float = 2.0,
+        search_cache_ttl: float = 3600.0,
+        response_cache_size: int = 256,
+    ):
+        """
+        Initialize data tools service.
+
+        Args:
+            route_cache_ttl: Seconds a routed default account stays valid
+            status_cache_ttl: Seconds a market status response is reused
+            search_cache_ttl: Seconds a symbol search response is reused
+            response_cache_size: Most responses kept per cached tool
+        """
         self.process_manager = get_process_manager()
         self.account_manager = get_account_manager()
         self.account_router = get_account_router()
+        self.quotes = _QuoteCoalescer(self._fetch_briefs)
+
+        # Set once the process manager is known to be running
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+        # Routed accounts by (use_default, operation_type): (monotonic time, id)
+        self.route_cache_ttl = route_cache_ttl
+        self._route_cache: Dict[Tuple[bool, str], Tuple[float, str]] = {}
+        self.account_manager.add_change_listener(self.invalidate_routes)
+
+        # Recent successful responses: tool -> key -> (monotonic time, response)
+        self._response_ttls = {
+            "market_status": status_cache_ttl,
+            "search_symbols": search_cache_ttl,
+        }
+        self.response_cache_size = response_cache_size
+        self._response_cache: Dict[str, Dict[Tuple[Any, ...], Tuple[float, Any]]] = {
+            tool: {} for tool in self._response_ttls
+        }
+
+    def invalidate_routes(self) -> None:
+        """Forget routed default accounts after an account change."""
+        self._route_cache.clear()
+
+    def get_cached_response(self, tool: str, key: Tuple[Any, ...]) -> Any:
+        """Return a cached response restamped for this call, or None."""
+        cached = self._response_cache[tool].get(key)
+        if cached and time.monotonic() - cached[0] < self._response_ttls[tool]:
+            return cached[1].model_copy(update={"timestamp": _response_timestamp()})
+        return None
+
+    def cache_response(self, tool: str, key: Tuple[Any, ...], response: Any) -> None:
+        """Remember a response, evicting the oldest entry when full."""
+        cache = self._response_cache[tool]
+        cache.pop(key, None)
+        cache[key] = (time.monotonic(), response)
+        if len(cache) > self.response_cache_size:
+            del cache[next(iter(cache))]
+
+    async def _fetch_briefs(self, account_id: str, symbols: List[str]) -> Any:
+        """Fetch stock briefs for a batch of symbols on one account."""
+        return await self.process_manager.execute_api_call(
+            account_id=account_id,
+            method="quote.get_stock_briefs",
+            kwargs={"symbols": symbols},
+            timeout=10.0,
+        )
 
     async def _route_account(
         self,
@@ -115,7 +362,19 @@ class DataToolsService:
         if account_id:
             # Use specified account
             return account_id
-        elif use_default:
+
+        key = (use_default, operation_type)
+        cached = self._route_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.route_cache_ttl:
+            return cached[1]
+
+        routed = await self._lookup_route(use_default, operation_type)
+        self._route_cache[key] = (time.monotonic(), routed)
+        return routed
+
+    async def _lookup_route(self, use_default: bool, operation_type: str) -> str:
+        """Resolve the account for a request that did not name one."""
+        if use_default:
             # Use default data account
             default_account = await self.account_manager.get_default_account("data")
             if default_account:
@@ -130,12 +389,17 @@ class DataToolsService:
             return await self.account_router.get_account_for_operation(operation_type)
 
     async def ensure_started(self):
-        """Ensure the process manager is started."""
-        if (
-            not hasattr(self.process_manager, "_started")
-            or not self.process_manager._started
-        ):
-            await self.process_manager.start()
+        """
+        Ensure the process manager is started.
+
+        Tools check ``_started`` first and only await this until it is set.
+        """
+        async with self._start_lock:
+            if self._started:
+                return
+            if not getattr(self.process_manager, "_started", False):
+                await self.process_manager.start()
+            self._started = True
 
 
 # Global service instance
@@ -178,49 +442,26 @@ async def tiger_get_quote(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Route to appropriate account
         target_account_id = await _data_service._route_account(
             data_account_id, True, "data"
         )
 
-        # Execute API call
-        result = await _data_service.process_manager.execute_api_call(
-            account_id=target_account_id,
-            method="quote.get_stock_brief",
-            kwargs={"symbols": [symbol]},
-            timeout=10.0,
-        )
+        # Concurrent quotes for the same account share one briefs call
+        brief = await _data_service.quotes.get(target_account_id, symbol)
 
         # Process single symbol result
         quote_data = None
-        if result and len(result) > 0:
-            brief = result[0]
-            quote_data = {
-                "symbol": brief.symbol if hasattr(brief, "symbol") else symbol,
-                "latest_price": (
-                    brief.latest_price if hasattr(brief, "latest_price") else 0
-                ),
-                "bid_price": brief.bid_price if hasattr(brief, "bid_price") else 0,
-                "ask_price": brief.ask_price if hasattr(brief, "ask_price") else 0,
-                "bid_size": brief.bid_size if hasattr(brief, "bid_size") else 0,
-                "ask_size": brief.ask_size if hasattr(brief, "ask_size") else 0,
-                "volume": brief.volume if hasattr(brief, "volume") else 0,
-                "prev_close": brief.prev_close if hasattr(brief, "prev_close") else 0,
-                "open": brief.open if hasattr(brief, "open") else 0,
-                "high": brief.high if hasattr(brief, "high") else 0,
-                "low": brief.low if hasattr(brief, "low") else 0,
-                "change": brief.change if hasattr(brief, "change") else 0,
-                "change_rate": (
-                    brief.change_rate if hasattr(brief, "change_rate") else 0
-                ),
-                "latest_time": (
-                    brief.latest_time if hasattr(brief, "latest_time") else None
-                ),
-            }
+        if brief is not None:
+            quote_data = _read_fields(
+                brief, _QUOTE_GET, {**_QUOTE_FIELDS, "symbol": symbol}
+            )
 
-        return QuoteResponse(
+        # Payloads are assembled here, so success responses skip re-validation
+        return QuoteResponse.model_construct(
             success=True, symbol=symbol, data=quote_data, account_id=target_account_id
         )
 
@@ -272,7 +513,8 @@ async def tiger_get_kline(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Validate count limit
         count = min(count, 300)
@@ -291,20 +533,13 @@ async def tiger_get_kline(
         )
 
         # Process k-line data
-        kline_data = []
-        if result:
-            for bar in result:
-                bar_data = {
-                    "time": bar.time if hasattr(bar, "time") else None,
-                    "open": bar.open if hasattr(bar, "open") else 0,
-                    "high": bar.high if hasattr(bar, "high") else 0,
-                    "low": bar.low if hasattr(bar, "low") else 0,
-                    "close": bar.close if hasattr(bar, "close") else 0,
-                    "volume": bar.volume if hasattr(bar, "volume") else 0,
-                }
-                kline_data.append(bar_data)
+        try:
+            kline_data = [dict(zip(_BAR_FIELDS, _BAR_GET(bar))) for bar in result or ()]
+        except AttributeError:
+            # Some bars lack fields; fill those from the defaults instead
+            kline_data = [_read_fields(bar, _BAR_GET, _BAR_FIELDS) for bar in result]
 
-        return KlineResponse(
+        return KlineResponse.model_construct(
             success=True,
             symbol=symbol,
             period=period,
@@ -355,10 +590,11 @@ async def tiger_get_market_data(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Limit symbols for performance
-        symbols = symbols[:50]  # Limit to 50 symbols
+        symbols = symbols[:MAX_BATCH_SYMBOLS]
 
         # Route to appropriate account
         target_account_id = await _data_service._route_account(
@@ -373,47 +609,24 @@ async def tiger_get_market_data(
             timeout=15.0,
         )
 
+        # Resolve the requested fields once for the whole batch
+        selected, getter = _BRIEF_FIELDS, _BRIEF_GET
+        if fields:
+            selected = {
+                field: _BRIEF_FIELDS[field]
+                for field in fields
+                if field in _BRIEF_FIELDS
+            }
+            getter = _fields_getter(selected) if selected else None
+
         # Process batch market data
         market_data = {}
-        if result:
-            for brief in result:
-                symbol = brief.symbol if hasattr(brief, "symbol") else ""
-
-                # Extract all available fields
-                symbol_data = {
-                    "symbol": symbol,
-                    "latest_price": (
-                        brief.latest_price if hasattr(brief, "latest_price") else 0
-                    ),
-                    "bid_price": brief.bid_price if hasattr(brief, "bid_price") else 0,
-                    "ask_price": brief.ask_price if hasattr(brief, "ask_price") else 0,
-                    "volume": brief.volume if hasattr(brief, "volume") else 0,
-                    "prev_close": (
-                        brief.prev_close if hasattr(brief, "prev_close") else 0
-                    ),
-                    "open": brief.open if hasattr(brief, "open") else 0,
-                    "high": brief.high if hasattr(brief, "high") else 0,
-                    "low": brief.low if hasattr(brief, "low") else 0,
-                    "change": brief.change if hasattr(brief, "change") else 0,
-                    "change_rate": (
-                        brief.change_rate if hasattr(brief, "change_rate") else 0
-                    ),
-                    "latest_time": (
-                        brief.latest_time if hasattr(brief, "latest_time") else None
-                    ),
-                }
-
-                # Filter fields if specified
-                if fields:
-                    symbol_data = {
-                        field: symbol_data.get(field)
-                        for field in fields
-                        if field in symbol_data
-                    }
-
-                market_data[symbol] = symbol_data
+        for brief in result or ():
+            market_data[getattr(brief, "symbol", "")] = (
+                _read_fields(brief, getter, selected) if getter else {}
+            )
 
-        return MarketDataResponse(
+        return MarketDataResponse.model_construct(
             success=True,
             symbols=symbols,
             fields=fields or [],
@@ -468,7 +681,14 @@ async def tiger_search_symbols(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        # Search results are effectively static, so recent ones are reused
+        cache_key = (keyword, market, data_account_id)
+        cached = _data_service.get_cached_response("search_symbols", cache_key)
+        if cached is not None:
+            return cached
+
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Route to appropriate account
         target_account_id = await _data_service._route_account(
@@ -487,24 +707,21 @@ async def tiger_search_symbols(
         search_results = []
         if result:
             for item in result:
-                result_data = {
-                    "symbol": item.symbol if hasattr(item, "symbol") else "",
-                    "name": item.name if hasattr(item, "name") else "",
-                    "market": item.market if hasattr(item, "market") else market,
-                    "sec_type": item.sec_type if hasattr(item, "sec_type") else "STK",
-                    "currency": item.currency if hasattr(item, "currency") else "USD",
-                    "exchange": item.exchange if hasattr(item, "exchange") else "",
-                    "exp_date": item.exp_date if hasattr(item, "exp_date") else None,
-                }
-                search_results.append(result_data)
+                search_results.append(
+                    _read_fields(
+                        item, _SYMBOL_GET, {**_SYMBOL_FIELDS, "market": market}
+                    )
+                )
 
-        return SymbolSearchResponse(
+        response = SymbolSearchResponse.model_construct(
             success=True,
             keyword=keyword,
             market=market,
             data=search_results,
             account_id=target_account_id,
         )
+        _data_service.cache_response("search_symbols", cache_key, response)
+        return response
 
     except Exception as e:
         logger.error(f"Failed to search symbols for keyword '{keyword}': {e}")
@@ -546,7 +763,8 @@ async def tiger_get_option_chain(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Route to appropriate account
         target_account_id = await _data_service._route_account(
@@ -564,74 +782,27 @@ async def tiger_get_option_chain(
         # Process option chain data
         option_data = None
         if result:
+            # Calls and puts share one pass, which also collects unique expiries
+            calls, puts, expiry_dates = [], [], set()
+            contracts = itertools.chain(
+                zip(itertools.repeat(calls), getattr(result, "calls", None) or ()),
+                zip(itertools.repeat(puts), getattr(result, "puts", None) or ()),
+            )
+            for side, contract in contracts:
+                contract_data = _read_fields(contract, _OPTION_GET, _OPTION_FIELDS)
+                side.append(contract_data)
+                if contract_data["expiry"]:
+                    expiry_dates.add(contract_data["expiry"])
+
             option_data = {
                 "underlying_symbol": symbol,
-                "underlying_price": (
-                    result.underlying_price
-                    if hasattr(result, "underlying_price")
-                    else 0
-                ),
-                "calls": [],
-                "puts": [],
-                "expiration_dates": [],
+                "underlying_price": getattr(result, "underlying_price", 0),
+                "calls": calls,
+                "puts": puts,
+                "expiration_dates": sorted(expiry_dates),
             }
 
-            # Process calls
-            if hasattr(result, "calls") and result.calls:
-                for call in result.calls:
-                    call_data = {
-                        "symbol": call.symbol if hasattr(call, "symbol") else "",
-                        "strike": call.strike if hasattr(call, "strike") else 0,
-                        "expiry": call.expiry if hasattr(call, "expiry") else None,
-                        "bid": call.bid if hasattr(call, "bid") else 0,
-                        "ask": call.ask if hasattr(call, "ask") else 0,
-                        "last_price": (
-                            call.last_price if hasattr(call, "last_price") else 0
-                        ),
-                        "volume": call.volume if hasattr(call, "volume") else 0,
-                        "open_interest": (
-                            call.open_interest if hasattr(call, "open_interest") else 0
-                        ),
-                        "implied_volatility": (
-                            call.implied_volatility
-                            if hasattr(call, "implied_volatility")
-                            else 0
-                        ),
-                    }
-                    option_data["calls"].append(call_data)
-
-            # Process puts
-            if hasattr(result, "puts") and result.puts:
-                for put in result.puts:
-                    put_data = {
-                        "symbol": put.symbol if hasattr(put, "symbol") else "",
-                        "strike": put.strike if hasattr(put, "strike") else 0,
-                        "expiry": put.expiry if hasattr(put, "expiry") else None,
-                        "bid": put.bid if hasattr(put, "bid") else 0,
-                        "ask": put.ask if hasattr(put, "ask") else 0,
-                        "last_price": (
-                            put.last_price if hasattr(put, "last_price") else 0
-                        ),
-                        "volume": put.volume if hasattr(put, "volume") else 0,
-                        "open_interest": (
-                            put.open_interest if hasattr(put, "open_interest") else 0
-                        ),
-                        "implied_volatility": (
-                            put.implied_volatility
-                            if hasattr(put, "implied_volatility")
-                            else 0
-                        ),
-                    }
-                    option_data["puts"].append(put_data)
-
-            # Extract unique expiration dates
-            all_options = option_data["calls"] + option_data["puts"]
-            expiry_dates = list(
-                set([opt["expiry"] for opt in all_options if opt["expiry"]])
-            )
-            option_data["expiration_dates"] = sorted(expiry_dates)
-
-        return OptionChainResponse(
+        return OptionChainResponse.model_construct(
             success=True, symbol=symbol, data=option_data, account_id=target_account_id
         )
 
@@ -680,7 +851,14 @@ async def tiger_get_market_status(
         ```
     """
     try:
-        await _data_service.ensure_started()
+        # Polling clients share one status lookup every couple of seconds
+        cache_key = (market, data_account_id)
+        cached = _data_service.get_cached_response("market_status", cache_key)
+        if cached is not None:
+            return cached
+
+        if not _data_service._started:
+            await _data_service.ensure_started()
 
         # Route to appropriate account
         target_account_id = await _data_service._route_account(
@@ -700,40 +878,14 @@ async def tiger_get_market_status(
         if result:
             status_data = {
                 "market": market,
-                "status": result.status if hasattr(result, "status") else "UNKNOWN",
-                "trading_date": (
-                    result.trading_date if hasattr(result, "trading_date") else None
-                ),
-                "open_time": result.open_time if hasattr(result, "open_time") else None,
-                "close_time": (
-                    result.close_time if hasattr(result, "close_time") else None
-                ),
-                "timezone": result.timezone if hasattr(result, "timezone") else "UTC",
-                "is_trading_day": (
-                    result.is_trading_day
-                    if hasattr(result, "is_trading_day")
-                    else False
-                ),
-                "pre_market_open": (
-                    result.pre_market_open
-                    if hasattr(result, "pre_market_open")
-                    else None
-                ),
-                "post_market_close": (
-                    result.post_market_close
-                    if hasattr(result, "post_market_close")
-                    else None
-                ),
-                "next_trading_day": (
-                    result.next_trading_day
-                    if hasattr(result, "next_trading_day")
-                    else None
-                ),
+                **_read_fields(result, _MARKET_STATUS_GET, _MARKET_STATUS_FIELDS),
             }
 
-        return MarketStatusResponse(
+        response = MarketStatusResponse.model_construct(
             success=True, market=market, data=status_data, account_id=target_account_id
         )
+        _data_service.cache_response("market_status", cache_key, response)
+        return response
 
     except Exception as e:
         logger.error(f"Failed to get market status for {market}: {e}")
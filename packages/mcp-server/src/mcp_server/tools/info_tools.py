@@ -5,15 +5,9 @@ Provides MCP tools for retrieving contract information, financial data,
 corporate actions, and other informational data through the Tiger API process pool.
 """
 
-import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-# Add paths for imports
-sys.path.insert(
-    0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-)
-
 from fastmcp import FastMCP
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -9,11 +9,6 @@ import asyncio
 import sys
 from typing import List
 
-# Add paths for imports
-sys.path.insert(
-    0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-)
-
 # Import tool functions to test
 from account_tools import (
     tiger_add_account,
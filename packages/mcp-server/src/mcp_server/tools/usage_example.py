@@ -5,14 +5,8 @@ Demonstrates how to use the MCP tools for various data retrieval operations.
 """
 
 import asyncio
-import sys
 from datetime import datetime
 
-# Add paths for imports
-sys.path.insert(
-    0, "/Volumes/extdisk/MyRepos/cctrading-ws/tiger-mcp/packages/shared/src"
-)
-
 from loguru import logger
 
 # Import MCP tools
@@ -147,6 +147,40 @@ async def mock_account_manager():
         yield mock_manager
 
 
+@pytest.fixture
+def tool_account_manager():
+    """
+    Account manager mock wired into the account and data tool services.
+
+    Patches the singleton getters both tool modules resolve, so a service
+    built inside the test uses this manager and mocked process/router
+    singletons.
+    """
+    mock_manager = MagicMock()
+    mock_manager.list_accounts = AsyncMock(
+        return_value=[MagicMock(market_permissions={"permissions": ["us_stock"]})]
+    )
+    mock_manager.get_default_account = AsyncMock(
+        return_value=MagicMock(account_number="DATA001")
+    )
+
+    with (
+        patch("mcp_server.tools.account_tools.get_process_manager"),
+        patch(
+            "mcp_server.tools.account_tools.get_account_manager",
+            return_value=mock_manager,
+        ),
+        patch("mcp_server.tools.account_tools.get_account_router"),
+        patch("mcp_server.tools.data_tools.get_process_manager"),
+        patch(
+            "mcp_server.tools.data_tools.get_account_manager",
+            return_value=mock_manager,
+        ),
+        patch("mcp_server.tools.data_tools.get_account_router"),
+    ):
+        yield mock_manager
+
+
 @pytest.fixture
 async def mock_account_router():
     """Mock account router."""
@@ -298,18 +332,31 @@ def mock_multiprocessing():
     mock_process.terminate = MagicMock()
     mock_process.kill = MagicMock()
 
-    mock_queue = MagicMock()
-    mock_queue.put = MagicMock()
-    mock_queue.get = MagicMock()
-    mock_queue.put_nowait = MagicMock()
-    mock_queue.get_nowait = MagicMock()
-    mock_queue.empty.return_value = False
+    mock_conn = MagicMock()
+    mock_conn.send = MagicMock()
+    mock_conn.recv = MagicMock()
+    mock_conn.poll.return_value = False
+
+    # Mock pipes have no real fd: run the result reader once per registration
+    def add_reader(loop, fd, callback, *args):
+        loop.call_soon(callback, *args)
 
     with (
         patch("multiprocessing.Process", return_value=mock_process),
-        patch("multiprocessing.Queue", return_value=mock_queue),
+        patch("multiprocessing.Pipe", return_value=(mock_conn, mock_conn)),
+        patch.object(
+            asyncio.selector_events.BaseSelectorEventLoop,
+            "add_reader",
+            autospec=True,
+            side_effect=add_reader,
+        ),
+        patch.object(
+            asyncio.selector_events.BaseSelectorEventLoop,
+            "remove_reader",
+            autospec=True,
+        ),
     ):
-        yield {"process": mock_process, "queue": mock_queue}
+        yield {"process": mock_process, "conn": mock_conn}
 
 
 # Utility fixtures
@@ -390,7 +437,12 @@ async def cleanup_after_test():
     yield
 
     # Clear any remaining asyncio tasks
-    pending_tasks = [task for task in asyncio.all_tasks() if not task.done()]
+    current_task = asyncio.current_task()
+    pending_tasks = [
+        task
+        for task in asyncio.all_tasks()
+        if task is not current_task and not task.done()
+    ]
     if pending_tasks:
         for task in pending_tasks:
             task.cancel()
@@ -0,0 +1,186 @@
+"""
+Unit tests for Tiger Process Manager.
+
+Tests the ProcessManager facade that coordinates the process pool:
+
+1. Health check caching and fan-out
+2. Process restart bookkeeping
+3. Batched API call execution
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.account_manager import AccountStatus
+
+from mcp_server.process_manager import ProcessManager
+
+
+class TestProcessManager:
+    """Test suite for ProcessManager."""
+
+    @pytest.fixture
+    def process_manager(self):
+        """Create a ProcessManager with mocked pool and account manager."""
+        mock_pool = MagicMock()
+        mock_pool.restart_process = AsyncMock(return_value=True)
+        mock_pool.get_all_processes = AsyncMock(return_value=[])
+        mock_pool.get_process_status = AsyncMock(return_value=MagicMock(pid=12345))
+
+        mock_account_manager = MagicMock()
+
+        with (
+            patch(
+                "mcp_server.process_manager.get_process_pool", return_value=mock_pool
+            ),
+            patch(
+                "mcp_server.process_manager.get_account_manager",
+                return_value=mock_account_manager,
+            ),
+        ):
+            manager = ProcessManager(health_cache_ttl=30.0)
+
+        return manager
+
+    @pytest.fixture
+    def active_accounts(self, process_manager):
+        """Register two active accounts with the mocked account manager."""
+        accounts = [MagicMock(id=uuid.uuid4()), MagicMock(id=uuid.uuid4())]
+        process_manager.account_manager.list_accounts = AsyncMock(return_value=accounts)
+        return accounts
+
+    @pytest.mark.asyncio
+    async def test_health_check_all_accounts_uses_cache(
+        self, process_manager, active_accounts
+    ):
+        """Test repeated health checks within the TTL reuse cached results."""
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": True}
+        )
+
+        first = await process_manager.health_check_all_accounts()
+        second = await process_manager.health_check_all_accounts()
+
+        assert first == second
+        assert process_manager.health_check_account.call_count == len(active_accounts)
+
+    @pytest.mark.asyncio
+    async def test_health_check_all_accounts_bypass_cache(
+        self, process_manager, active_accounts
+    ):
+        """Test use_cache=False always probes the worker processes."""
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": True}
+        )
+
+        await process_manager.health_check_all_accounts()
+        await process_manager.health_check_all_accounts(use_cache=False)
+
+        assert process_manager.health_check_account.call_count == 2 * len(
+            active_accounts
+        )
+
+    @pytest.mark.asyncio
+    async def test_health_cache_expires(self, process_manager, active_accounts):
+        """Test cached results older than the TTL are refreshed."""
+        process_manager.health_cache_ttl = 0.0
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": True}
+        )
+
+        await process_manager.health_check_all_accounts()
+        await process_manager.health_check_all_accounts()
+
+        assert process_manager.health_check_account.call_count == 2 * len(
+            active_accounts
+        )
+
+    @pytest.mark.asyncio
+    async def test_restart_invalidates_health_cache(
+        self, process_manager, active_accounts
+    ):
+        """Test restarting an account's process drops its cached health."""
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": True}
+        )
+        await process_manager.health_check_all_accounts()
+
+        restarted_id = str(active_accounts[0].id)
+        assert await process_manager.restart_account_process(restarted_id)
+        assert restarted_id not in process_manager._health_cache
+
+        await process_manager.health_check_all_accounts()
+        assert process_manager.health_check_account.call_count == (
+            len(active_accounts) + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_results_not_cached(self, process_manager, active_accounts):
+        """Test failed probes are retried on the next poll."""
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": False}
+        )
+
+        await process_manager.health_check_all_accounts()
+        await process_manager.health_check_all_accounts()
+
+        assert process_manager.health_check_account.call_count == 2 * len(
+            active_accounts
+        )
+
+    @pytest.mark.asyncio
+    async def test_health_cache_invalidated_by_new_worker(
+        self, process_manager, active_accounts
+    ):
+        """Test a worker replaced by the pool does not reuse the old result."""
+        process_manager.health_check_account = AsyncMock(
+            side_effect=lambda account_id: {"account_id": account_id, "healthy": True}
+        )
+        await process_manager.health_check_all_accounts()
+
+        # Pool restarted the workers on its own (e.g. after a timeout)
+        process_manager.process_pool.get_process_status.return_value = MagicMock(
+            pid=54321
+        )
+        await process_manager.health_check_all_accounts()
+
+        assert process_manager.health_check_account.call_count == 2 * len(
+            active_accounts
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_api_calls_sends_one_batch_task(self, process_manager):
+        """Test a batch reaches the worker as one task with per-call results."""
+        account_id = str(uuid.uuid4())
+        process_manager.account_manager.get_account_by_id = AsyncMock(
+            return_value=MagicMock(status=AccountStatus.ACTIVE)
+        )
+        process_manager.process_pool.execute_task = AsyncMock(
+            return_value=[
+                {"success": True, "result": {"healthy": True}},
+                {"success": False, "error": "market closed"},
+            ]
+        )
+
+        results = await process_manager.execute_api_calls(
+            account_id,
+            [("health_check", None, None), ("quote.get_market_status", ["US"], None)],
+        )
+
+        process_manager.process_pool.execute_task.assert_awaited_once_with(
+            account_id=account_id,
+            method="batch",
+            args=[
+                [
+                    ["health_check", None, None],
+                    ["quote.get_market_status", ["US"], None],
+                ]
+            ],
+            timeout=30.0,
+        )
+        process_manager.account_manager.get_account_by_id.assert_awaited_once()
+        assert results[0] == {"healthy": True}
+        assert isinstance(results[1], RuntimeError)
+        assert "market closed" in str(results[1])
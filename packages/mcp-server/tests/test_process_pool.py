@@ -13,6 +13,10 @@ for Tiger SDK single-account limitation. Tests cover:
 """
 
 import asyncio
+import functools
+import itertools
+import multiprocessing as mp
+import time
 import uuid
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -21,13 +25,24 @@ import pytest
 
 # Import the class under test
 from mcp_server.tiger_process_pool import (
+    HEARTBEAT_STRIDE,
     ProcessInfo,
     ProcessStatus,
+    TaskResponse,
     TigerProcessPool,
     get_process_pool,
 )
 
 
+def answer_task(pool, task, **fields):
+    """Resolve the future of a task sent to a mocked worker."""
+    for pending in pool._pending.values():
+        if task.task_id in pending:
+            pending[task.task_id].set_result(
+                TaskResponse(task_id=task.task_id, **fields)
+            )
+
+
 class TestTigerProcessPool:
     """Test suite for TigerProcessPool."""
 
@@ -106,15 +121,15 @@ class TestTigerProcessPool:
 
             # Setup multiprocessing mocks
             mock_process = mock_multiprocessing["process"]
-            mock_queue = mock_multiprocessing["queue"]
+            mock_conn = mock_multiprocessing["conn"]
 
             # Mock ready signal from worker
             ready_message = {
                 "type": "ready",
                 "timestamp": datetime.utcnow().isoformat(),
             }
-            mock_queue.empty.return_value = False
-            mock_queue.get_nowait.return_value = ready_message
+            mock_conn.poll.side_effect = [True, False]
+            mock_conn.recv.return_value = ready_message
 
             # Execute process creation
             process_id = str(uuid.uuid4())
@@ -154,8 +169,8 @@ class TestTigerProcessPool:
             mock_get_account.return_value = account
 
             # Setup multiprocessing mocks - no ready signal
-            mock_queue = mock_multiprocessing["queue"]
-            mock_queue.empty.return_value = True  # No ready message
+            mock_conn = mock_multiprocessing["conn"]
+            mock_conn.poll.return_value = False  # No ready message
 
             # Execute process creation
             process_id = str(uuid.uuid4())
@@ -264,30 +279,26 @@ class TestTigerProcessPool:
         process_pool.processes[process_id] = process_info
         process_pool.account_to_process[account_id] = process_id
 
-        # Setup queues
-        task_queue = mock_multiprocessing["queue"]
-        result_queue = mock_multiprocessing["queue"]
-        process_pool.task_queues[process_id] = task_queue
-        process_pool.result_queues[process_id] = result_queue
+        # Setup pipes
+        task_conn = mock_multiprocessing["conn"]
+        result_conn = mock_multiprocessing["conn"]
+        process_pool.task_conns[process_id] = task_conn
+        process_pool.result_conns[process_id] = result_conn
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
 
         # Mock task response
         task_response = {
-            "task_id": "test_task_123",
             "success": True,
             "result": {"quote": {"symbol": "AAPL", "price": 150.25}},
             "execution_time": 0.5,
-            "timestamp": datetime.utcnow().isoformat(),
         }
 
-        # Mock async queue operations
-        async def mock_put_queue_async(queue, item, timeout=None):
-            pass
-
-        async def mock_get_queue_async(queue, timeout=None):
-            return task_response
+        # Mock worker: answer the task as soon as it is sent
+        async def mock_send_async(conn, item):
+            answer_task(process_pool, item, **task_response)
 
-        process_pool._put_queue_async = mock_put_queue_async
-        process_pool._get_queue_async = mock_get_queue_async
+        process_pool._send_async = mock_send_async
 
         # Execute task
         result = await process_pool.execute_task(
@@ -322,16 +333,15 @@ class TestTigerProcessPool:
 
         process_pool.processes[process_id] = process_info
         process_pool.account_to_process[account_id] = process_id
+        process_pool.task_conns[process_id] = MagicMock()
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
 
-        # Mock timeout in queue operations
-        async def mock_put_queue_async(queue, item, timeout=None):
+        # Mock worker that never answers
+        async def mock_send_async(conn, item):
             pass
 
-        async def mock_get_queue_async(queue, timeout=None):
-            raise TimeoutError("Task execution timed out")
-
-        process_pool._put_queue_async = mock_put_queue_async
-        process_pool._get_queue_async = mock_get_queue_async
+        process_pool._send_async = mock_send_async
 
         # Mock restart process
         process_pool._restart_process = AsyncMock()
@@ -339,12 +349,13 @@ class TestTigerProcessPool:
         # Execute task
         with pytest.raises(TimeoutError, match="Task execution timed out"):
             await process_pool.execute_task(
-                account_id=account_id, method="get_quote", args=["AAPL"], timeout=5.0
+                account_id=account_id, method="get_quote", args=["AAPL"], timeout=0.05
             )
 
         # Verify process status and restart
         assert process_info.status == ProcessStatus.ERROR
         process_pool._restart_process.assert_called_once_with(process_id)
+        assert process_pool._pending[process_id] == {}
 
     @pytest.mark.asyncio
     async def test_execute_task_failure(self, process_pool, mock_account_data):
@@ -364,26 +375,23 @@ class TestTigerProcessPool:
 
         process_pool.processes[process_id] = process_info
         process_pool.account_to_process[account_id] = process_id
+        process_pool.task_conns[process_id] = MagicMock()
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
 
         # Mock task failure response
         task_response = {
-            "task_id": "test_task_123",
             "success": False,
             "result": None,
             "error": "API call failed",
             "execution_time": 0.5,
-            "timestamp": datetime.utcnow().isoformat(),
         }
 
-        # Mock async queue operations
-        async def mock_put_queue_async(queue, item, timeout=None):
-            pass
-
-        async def mock_get_queue_async(queue, timeout=None):
-            return task_response
+        # Mock worker: answer the task as soon as it is sent
+        async def mock_send_async(conn, item):
+            answer_task(process_pool, item, **task_response)
 
-        process_pool._put_queue_async = mock_put_queue_async
-        process_pool._get_queue_async = mock_get_queue_async
+        process_pool._send_async = mock_send_async
 
         # Mock restart process (will be called due to error count)
         process_pool._restart_process = AsyncMock()
@@ -400,6 +408,120 @@ class TestTigerProcessPool:
         assert process_info.error_count == 3
         process_pool._restart_process.assert_called_once_with(process_id)
 
+    @pytest.mark.asyncio
+    async def test_execute_task_reuses_worker_pipes(self, process_pool):
+        """Test back-to-back tasks share one worker and its pipe pair."""
+        account_id = str(uuid.uuid4())
+        process_id = str(uuid.uuid4())
+
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=account_id,
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.account_to_process[account_id] = process_id
+        task_conn = MagicMock()
+        result_conn = MagicMock()
+        process_pool.task_conns[process_id] = task_conn
+        process_pool.result_conns[process_id] = result_conn
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
+
+        send_conns = []
+
+        async def mock_send_async(conn, item):
+            send_conns.append(conn)
+            answer_task(process_pool, item, success=True, result="ok")
+
+        process_pool._send_async = mock_send_async
+        process_pool._create_process = AsyncMock()
+
+        for _ in range(5):
+            assert await process_pool.execute_task(account_id, "health_check") == "ok"
+
+        process_pool._create_process.assert_not_called()
+        assert send_conns == [task_conn] * 5
+
+    @pytest.mark.asyncio
+    async def test_execute_task_pipelines_on_one_worker(self, process_pool):
+        """Test concurrent tasks share a worker and each gets its own result."""
+        account_id = str(uuid.uuid4())
+        process_id = str(uuid.uuid4())
+        process_info = ProcessInfo(
+            process_id=process_id,
+            account_id=account_id,
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.processes[process_id] = process_info
+        process_pool.account_to_process[account_id] = process_id
+        process_pool.task_conns[process_id] = MagicMock()
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
+
+        sent = []
+
+        async def mock_send_async(conn, item):
+            sent.append(item)
+
+        process_pool._send_async = mock_send_async
+
+        first = asyncio.create_task(process_pool.execute_task(account_id, "first"))
+        second = asyncio.create_task(process_pool.execute_task(account_id, "second"))
+        await asyncio.sleep(0)
+        assert [task.method for task in sent] == ["first", "second"]
+        assert sent[1].task_id == sent[0].task_id + 1
+
+        # Worker answers out of order
+        answer_task(process_pool, sent[1], success=True, result="second")
+        assert await second == "second"
+        assert process_info.status == ProcessStatus.BUSY
+
+        answer_task(process_pool, sent[0], success=True, result="first")
+        assert await first == "first"
+        assert process_info.status == ProcessStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_execute_task_bounded_by_prefetch_depth(self, process_pool):
+        """Test a worker never has more than prefetch_depth tasks queued."""
+        account_id = str(uuid.uuid4())
+        process_id = str(uuid.uuid4())
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=account_id,
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.account_to_process[account_id] = process_id
+        process_pool.task_conns[process_id] = MagicMock()
+        process_pool._pending[process_id] = {}
+        process_pool._in_flight[process_id] = asyncio.Semaphore(2)
+
+        sent = []
+
+        async def mock_send_async(conn, item):
+            sent.append(item)
+
+        process_pool._send_async = mock_send_async
+
+        tasks = [
+            asyncio.create_task(process_pool.execute_task(account_id, f"call_{i}"))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert len(sent) == 2
+
+        # Completing one task lets the next one through
+        answer_task(process_pool, sent[0], success=True, result=0)
+        assert await tasks[0] == 0
+        await asyncio.sleep(0)
+        assert len(sent) == 3
+
+        for i, task in enumerate(sent[1:], start=1):
+            answer_task(process_pool, task, success=True, result=i)
+        assert await asyncio.gather(*tasks) == [0, 1, 2]
+
     @pytest.mark.asyncio
     async def test_restart_process(
         self, process_pool, mock_account_data, mock_multiprocessing
@@ -449,13 +571,13 @@ class TestTigerProcessPool:
         process_pool.processes[process_id] = process_info
         process_pool.account_to_process[account_id] = process_id
 
-        # Setup mock process and queues
+        # Setup mock process and pipes
         mock_process = mock_multiprocessing["process"]
-        mock_queue = mock_multiprocessing["queue"]
+        mock_conn = mock_multiprocessing["conn"]
 
         process_pool.process_pool[process_id] = mock_process
-        process_pool.task_queues[process_id] = mock_queue
-        process_pool.result_queues[process_id] = mock_queue
+        process_pool.task_conns[process_id] = mock_conn
+        process_pool.result_conns[process_id] = mock_conn
 
         # Mock graceful shutdown
         mock_process.join.return_value = None  # Process stops gracefully
@@ -471,7 +593,7 @@ class TestTigerProcessPool:
         assert process_info.status == ProcessStatus.STOPPED
 
         # Verify graceful shutdown was attempted
-        mock_queue.put_nowait.assert_called_once()
+        mock_conn.send_bytes.assert_called_once()
         mock_process.join.assert_called()
 
     @pytest.mark.asyncio
@@ -500,11 +622,11 @@ class TestTigerProcessPool:
             True,
             False,
         ]  # Alive after terminate, dead after kill
-        mock_queue = mock_multiprocessing["queue"]
+        mock_conn = mock_multiprocessing["conn"]
 
         process_pool.process_pool[process_id] = mock_process
-        process_pool.task_queues[process_id] = mock_queue
-        process_pool.result_queues[process_id] = mock_queue
+        process_pool.task_conns[process_id] = mock_conn
+        process_pool.result_conns[process_id] = mock_conn
 
         # Execute removal
         result = await process_pool._remove_process(process_id)
@@ -530,18 +652,18 @@ class TestTigerProcessPool:
                 account_id=account.id,
                 account_number=account.account_number,
                 status=ProcessStatus.READY,
-                last_heartbeat=datetime.utcnow() - timedelta(seconds=5),
+                last_heartbeat_ns=time.monotonic_ns() - 5_000_000_000,
             )
             processes.append((process_id, process_info, account))
 
             process_pool.processes[process_id] = process_info
             process_pool.account_to_process[account.id] = process_id
 
-            # Setup mock process and queues
+            # Setup mock process and pipes
             mock_process = mock_multiprocessing["process"]
-            mock_queue = mock_multiprocessing["queue"]
+            mock_conn = mock_multiprocessing["conn"]
             process_pool.process_pool[process_id] = mock_process
-            process_pool.task_queues[process_id] = mock_queue
+            process_pool.task_conns[process_id] = mock_conn
 
         # Start monitoring
         process_pool._monitoring_active = True
@@ -555,13 +677,13 @@ class TestTigerProcessPool:
                 if process and process.is_alive():
                     # Send heartbeat check
                     if process_info.status == ProcessStatus.READY:
-                        task_queue = process_pool.task_queues.get(process_id)
-                        if task_queue:
+                        task_conn = process_pool.task_conns.get(process_id)
+                        if task_conn:
                             heartbeat_task = {
                                 "type": "heartbeat",
                                 "timestamp": current_time.isoformat(),
                             }
-                            task_queue.put_nowait(heartbeat_task)
+                            task_conn.send(heartbeat_task)
 
         # Run monitoring cycle
         await single_monitor_cycle()
@@ -569,8 +691,8 @@ class TestTigerProcessPool:
         # Verify heartbeat messages were sent to ready processes
         for process_id, process_info, account in processes:
             if process_info.status == ProcessStatus.READY:
-                task_queue = process_pool.task_queues[process_id]
-                task_queue.put_nowait.assert_called()
+                task_conn = process_pool.task_conns[process_id]
+                task_conn.send.assert_called()
 
     @pytest.mark.asyncio
     async def test_process_monitoring_dead_process(
@@ -616,15 +738,15 @@ class TestTigerProcessPool:
         account = mock_account_data.accounts[0]
         process_id = str(uuid.uuid4())
 
-        old_heartbeat = datetime.utcnow() - timedelta(
-            seconds=process_pool.process_timeout + 10
+        old_heartbeat_ns = time.monotonic_ns() - int(
+            (process_pool.process_timeout + 10) * 1e9
         )
         process_info = ProcessInfo(
             process_id=process_id,
             account_id=account.id,
             account_number=account.account_number,
             status=ProcessStatus.READY,
-            last_heartbeat=old_heartbeat,
+            last_heartbeat_ns=old_heartbeat_ns,
         )
 
         process_pool.processes[process_id] = process_info
@@ -692,6 +814,293 @@ class TestTigerProcessPool:
         assert len(result) == len(processes)
         assert set(result) == set(processes)
 
+    @pytest.mark.asyncio
+    async def test_wait_until_ready(self, process_pool):
+        """Test waiting for a worker to signal ready."""
+        account_id = str(uuid.uuid4())
+
+        waiter = asyncio.create_task(
+            process_pool.wait_until_ready(account_id, timeout=5.0)
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        process_pool._ready_events[account_id].set()
+        assert await waiter is True
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_timeout(self, process_pool):
+        """Test waiting for a worker that never becomes ready."""
+        account_id = str(uuid.uuid4())
+
+        assert await process_pool.wait_until_ready(account_id, timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_remove_process_drops_ready_event(self, process_pool):
+        """Test permanently removing a process forgets its ready event."""
+        account_id = str(uuid.uuid4())
+        process_id = str(uuid.uuid4())
+        process_pool.account_to_process[account_id] = process_id
+        process_pool._get_ready_event(account_id).set()
+        process_pool._remove_process = AsyncMock(return_value=True)
+
+        assert await process_pool.remove_process(account_id) is True
+        assert account_id not in process_pool._ready_events
+
+    @pytest.mark.asyncio
+    async def test_results_routed_by_task_id(self, process_pool):
+        """Test out-of-order results on a real pipe reach the right tasks."""
+        process_id = str(uuid.uuid4())
+        recv_conn, send_conn = mp.Pipe(duplex=False)
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.result_conns[process_id] = recv_conn
+        loop = asyncio.get_running_loop()
+        first, second = loop.create_future(), loop.create_future()
+        process_pool._pending[process_id] = {1: first, 2: second}
+
+        for task_id in (2, 1):
+            await process_pool._send_async(
+                send_conn, TaskResponse(task_id=task_id, success=True, result=task_id)
+            )
+        process_pool._on_result_ready(process_id)
+
+        assert first.result().result == 1
+        assert second.result().result == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_results_resolve_each_task(self, process_pool):
+        """Test a list of responses sent in one frame resolves every task."""
+        process_id = str(uuid.uuid4())
+        recv_conn, send_conn = mp.Pipe(duplex=False)
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.result_conns[process_id] = recv_conn
+        loop = asyncio.get_running_loop()
+        futures = {task_id: loop.create_future() for task_id in (1, 2, 3)}
+        process_pool._pending[process_id] = dict(futures)
+
+        await process_pool._send_async(
+            send_conn,
+            [
+                TaskResponse(task_id=task_id, success=True, result=task_id)
+                for task_id in (3, 1, 2)
+            ],
+        )
+        process_pool._on_result_ready(process_id)
+
+        assert {tid: f.result().result for tid, f in futures.items()} == {
+            1: 1,
+            2: 2,
+            3: 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unreadable_result_fails_waiting_tasks(self, process_pool):
+        """Test a message that fails to unpickle fails tasks instead of hanging."""
+        process_id = str(uuid.uuid4())
+        recv_conn, send_conn = mp.Pipe(duplex=False)
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.result_conns[process_id] = recv_conn
+        loop = asyncio.get_running_loop()
+        first, second = loop.create_future(), loop.create_future()
+        process_pool._pending[process_id] = {1: first, 2: second}
+
+        send_conn.send_bytes(b"not a pickle")
+        await process_pool._send_async(
+            send_conn, TaskResponse(task_id=2, success=True, result=2)
+        )
+        process_pool._on_result_ready(process_id)
+
+        # The bad frame is skipped and the next message is still delivered
+        assert second.result().result == 2
+        with pytest.raises(RuntimeError, match="Unreadable result"):
+            first.result()
+
+    async def _run_monitor_once(self, process_pool):
+        """Run the monitoring loop for a single pass."""
+        process_pool._monitoring_active = True
+        monitor = asyncio.create_task(process_pool._monitor_processes())
+        await asyncio.sleep(0.005)
+        process_pool._monitoring_active = False
+        monitor.cancel()
+        await monitor
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("age_s, restarted", [(1, False), (600, True)])
+    async def test_monitor_reads_shared_heartbeat(self, process_pool, age_s, restarted):
+        """Test the monitor judges liveness from the worker-written stamp."""
+        process_id = str(uuid.uuid4())
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.BUSY,
+        )
+        process_pool.process_pool[process_id] = MagicMock()
+        slot = process_pool._claim_heartbeat_slot(process_id)
+        process_pool._heartbeat_ns[slot * HEARTBEAT_STRIDE] -= age_s * 1_000_000_000
+        process_pool._restart_process = AsyncMock()
+
+        await self._run_monitor_once(process_pool)
+
+        assert process_pool._restart_process.called is restarted
+
+    @pytest.mark.asyncio
+    async def test_start_prewarms_accounts(self, process_pool):
+        """Test start() creates workers for configured accounts up front."""
+        process_pool.prewarm_accounts = ["acc-1", "acc-2"]
+        process_pool.get_or_create_process = AsyncMock(
+            side_effect=["proc-1", RuntimeError("account disabled")]
+        )
+
+        try:
+            await process_pool.start()
+        finally:
+            process_pool._monitoring_active = False
+            process_pool._monitoring_task.cancel()
+
+        assert [
+            call.args[0] for call in process_pool.get_or_create_process.await_args_list
+        ] == ["acc-1", "acc-2"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("age_s, pinged", [(0, False), (30, True)])
+    async def test_monitor_skips_heartbeat_for_fresh_workers(
+        self, process_pool, age_s, pinged
+    ):
+        """Test heartbeats go only to workers whose stamp has gone stale."""
+        process_id = str(uuid.uuid4())
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.process_pool[process_id] = MagicMock()
+        task_conn = process_pool.task_conns[process_id] = MagicMock()
+        slot = process_pool._claim_heartbeat_slot(process_id)
+        process_pool._heartbeat_ns[slot * HEARTBEAT_STRIDE] -= age_s * 1_000_000_000
+
+        await self._run_monitor_once(process_pool)
+
+        assert task_conn.send_bytes.called is pinged
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "task_count, in_flight, recycled",
+        [(99, False, False), (100, True, False), (100, False, True)],
+    )
+    async def test_monitor_recycles_worn_workers(
+        self, process_pool, task_count, in_flight, recycled
+    ):
+        """Test idle workers are restarted once they reach the task quota."""
+        process_id = str(uuid.uuid4())
+        process_pool.max_tasks_per_process = 100
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.BUSY,
+            task_count=task_count,
+        )
+        process_pool.process_pool[process_id] = MagicMock()
+        process_pool._pending[process_id] = {1: MagicMock()} if in_flight else {}
+        process_pool._restart_process = AsyncMock()
+
+        await self._run_monitor_once(process_pool)
+
+        assert process_pool._restart_process.called is recycled
+
+    def test_last_heartbeat_reported_as_datetime(self):
+        """Test the monotonic heartbeat stamp converts to wall-clock time."""
+        process_info = ProcessInfo(
+            process_id="p1",
+            account_id="a1",
+            account_number="TEST001",
+            last_heartbeat_ns=time.monotonic_ns() - 30_000_000_000,
+        )
+
+        age = datetime.utcnow() - process_info.last_heartbeat
+        assert timedelta(seconds=29) < age < timedelta(seconds=31)
+
+    def test_heartbeat_slots_are_reused(self):
+        """Test heartbeat slots are recycled and never exceed the pool size."""
+        pool = TigerProcessPool(max_processes=2)
+
+        first = pool._claim_heartbeat_slot("p1")
+        second = pool._claim_heartbeat_slot("p2")
+        assert {first, second} == {0, 1}
+        assert pool._claim_heartbeat_slot("p1") == first
+        with pytest.raises(RuntimeError, match="No free heartbeat slot"):
+            pool._claim_heartbeat_slot("p3")
+
+        pool._slot_process[pool._process_slot.pop("p1")] = None
+        assert pool._claim_heartbeat_slot("p3") == first
+
+    @pytest.mark.asyncio
+    async def test_worker_exit_triggers_restart(self, process_pool):
+        """Test a worker whose process exits is restarted without polling."""
+        process_id = str(uuid.uuid4())
+        recv_conn, send_conn = mp.Pipe(duplex=False)
+        process = MagicMock(sentinel=recv_conn.fileno())
+        process.is_alive.return_value = False
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=str(uuid.uuid4()),
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.process_pool[process_id] = process
+        restarted = asyncio.Event()
+        process_pool._restart_process = AsyncMock(side_effect=lambda _: restarted.set())
+        loop = asyncio.get_running_loop()
+        loop.add_reader(process.sentinel, process_pool._on_worker_exit, process_id)
+        process_pool._exit_watchers[process_id] = process.sentinel
+
+        # Closing the write end makes the stand-in sentinel readable
+        send_conn.close()
+        await asyncio.wait_for(restarted.wait(), timeout=1.0)
+
+        process_pool._restart_process.assert_awaited_once_with(process_id)
+        assert process_id not in process_pool._exit_watchers
+        recv_conn.close()
+
+    @pytest.mark.asyncio
+    async def test_remove_process_fails_pending_tasks(self, process_pool):
+        """Test tasks waiting on a removed worker fail instead of hanging."""
+        process_id = str(uuid.uuid4())
+        account_id = str(uuid.uuid4())
+        process = MagicMock()
+        process.is_alive.return_value = False
+        process_pool.processes[process_id] = ProcessInfo(
+            process_id=process_id,
+            account_id=account_id,
+            account_number="TEST001",
+            status=ProcessStatus.READY,
+        )
+        process_pool.account_to_process[account_id] = process_id
+        process_pool.process_pool[process_id] = process
+        future = asyncio.get_running_loop().create_future()
+        process_pool._pending[process_id] = {1: future}
+
+        assert await process_pool._remove_process(process_id) is True
+        with pytest.raises(RuntimeError, match="stopped"):
+            future.result()
+
     @pytest.mark.asyncio
     async def test_restart_process_by_account(self, process_pool, mock_account_data):
         """Test restarting process by account ID."""
@@ -820,10 +1229,10 @@ class TestProcessPoolIntegration:
                 mock_account_manager.get_account_by_id.return_value = account
 
                 # Mock process creation success
-                mock_queue = mock_multiprocessing["queue"]
+                mock_conn = mock_multiprocessing["conn"]
                 ready_message = {"type": "ready"}
-                mock_queue.empty.return_value = False
-                mock_queue.get_nowait.return_value = ready_message
+                mock_conn.poll.side_effect = itertools.cycle([True, False])
+                mock_conn.recv.return_value = ready_message
 
                 # Create process for account
                 process_id = await pool.get_or_create_process(account.id)
@@ -832,21 +1241,15 @@ class TestProcessPoolIntegration:
 
                 # Mock task execution
                 task_response = {
-                    "task_id": "test_task",
                     "success": True,
                     "result": {"data": "test_result"},
                     "execution_time": 0.1,
-                    "timestamp": datetime.utcnow().isoformat(),
                 }
 
-                async def mock_put_queue_async(queue, item, timeout=None):
-                    pass
-
-                async def mock_get_queue_async(queue, timeout=None):
-                    return task_response
+                async def mock_send_async(conn, item):
+                    answer_task(pool, item, **task_response)
 
-                pool._put_queue_async = mock_put_queue_async
-                pool._get_queue_async = mock_get_queue_async
+                pool._send_async = mock_send_async
 
                 # Execute task
                 result = await pool.execute_task(
@@ -899,10 +1302,10 @@ class TestProcessPoolIntegration:
                 )
 
                 # Mock successful process creation
-                mock_queue = mock_multiprocessing["queue"]
+                mock_conn = mock_multiprocessing["conn"]
                 ready_message = {"type": "ready"}
-                mock_queue.empty.return_value = False
-                mock_queue.get_nowait.return_value = ready_message
+                mock_conn.poll.side_effect = itertools.cycle([True, False])
+                mock_conn.recv.return_value = ready_message
 
                 # Create processes concurrently
                 create_tasks = [
@@ -916,22 +1319,19 @@ class TestProcessPoolIntegration:
 
                 # Mock task execution
                 task_response = {
-                    "task_id": "test_task",
                     "success": True,
                     "result": {"data": "concurrent_result"},
                     "execution_time": 0.1,
-                    "timestamp": datetime.utcnow().isoformat(),
                 }
 
-                async def mock_put_queue_async(queue, item, timeout=None):
+                async def mock_send_async(conn, item):
                     await asyncio.sleep(0.01)  # Simulate some delay
+                    asyncio.get_running_loop().call_later(
+                        0.02,  # Simulate processing time
+                        functools.partial(answer_task, pool, item, **task_response),
+                    )
 
-                async def mock_get_queue_async(queue, timeout=None):
-                    await asyncio.sleep(0.02)  # Simulate processing time
-                    return task_response
-
-                pool._put_queue_async = mock_put_queue_async
-                pool._get_queue_async = mock_get_queue_async
+                pool._send_async = mock_send_async
 
                 # Execute tasks concurrently on different accounts
                 task_execution_tasks = [
@@ -991,10 +1391,10 @@ class TestProcessPoolIntegration:
                 mock_account_manager.get_account_by_id.return_value = account
 
                 # Mock process creation success initially
-                mock_queue = mock_multiprocessing["queue"]
+                mock_conn = mock_multiprocessing["conn"]
                 ready_message = {"type": "ready"}
-                mock_queue.empty.return_value = False
-                mock_queue.get_nowait.return_value = ready_message
+                mock_conn.poll.side_effect = itertools.cycle([True, False])
+                mock_conn.recv.return_value = ready_message
 
                 # Create process
                 process_id = await pool.get_or_create_process(account.id)
@@ -1002,22 +1402,16 @@ class TestProcessPoolIntegration:
 
                 # Simulate process failure during task execution
                 error_response = {
-                    "task_id": "failing_task",
                     "success": False,
                     "result": None,
                     "error": "Simulated API failure",
                     "execution_time": 0.1,
-                    "timestamp": datetime.utcnow().isoformat(),
                 }
 
-                async def mock_put_queue_async(queue, item, timeout=None):
-                    pass
-
-                async def mock_get_queue_async(queue, timeout=None):
-                    return error_response
+                async def mock_send_async(conn, item):
+                    answer_task(pool, item, **error_response)
 
-                pool._put_queue_async = mock_put_queue_async
-                pool._get_queue_async = mock_get_queue_async
+                pool._send_async = mock_send_async
 
                 # Mock restart operations
                 pool._remove_process = AsyncMock(return_value=True)
@@ -0,0 +1,386 @@
+"""
+Integration tests for Tiger Process Pool Manager.
+
+Tests process isolation, account management, and API execution against
+real worker processes. A single ProcessManager and one set of test
+accounts are shared by every test in the session.
+
+Run with ``pytest -m integration tests/test_process_pool_integration.py``
+or execute this module directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
+import pytest_asyncio
+from database.models.accounts import MarketPermission
+from loguru import logger
+from shared.account_manager import AccountType, get_account_manager
+
+from mcp_server.process_manager import ProcessManager, get_process_manager
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
+
+
+class ApiCallSpec(NamedTuple):
+    """API call exercised by test_api_calls."""
+
+    method: str
+    args: Optional[List[Any]] = None
+    kwargs: Optional[Dict[str, Any]] = None
+
+
+# Allocated once per process; None args/kwargs are passed through unchanged
+TEST_CALLS: Tuple[ApiCallSpec, ...] = (
+    ApiCallSpec("health_check"),
+    ApiCallSpec("quote.get_market_status"),  # This will likely fail in test env
+    ApiCallSpec("trade.get_account"),  # This will likely fail in test env
+)
+
+
+async def create_test_accounts() -> List:
+    """Create the test accounts shared by the session."""
+    logger.info("=== Creating Test Accounts ===")
+
+    account_manager = get_account_manager()
+
+    # Create test accounts
+    test_accounts = []
+
+    try:
+        # Account 1 - Sandbox
+        account1 = await account_manager.create_account(
+            account_name="Test Account 1",
+            account_number="TEST001",
+            tiger_id="test_tiger_id_1",
+            private_key="test_private_key_1",
+            account_type=AccountType.PAPER,
+            environment="sandbox",
+            market_permissions=[MarketPermission.US_STOCK],
+            description="Test account for process pool testing",
+            is_default_data=True,
+        )
+        test_accounts.append(account1)
+        logger.info("Created account 1: {} ({})", account1.account_name, account1.id)
+
+        # Account 2 - Sandbox
+        account2 = await account_manager.create_account(
+            account_name="Test Account 2",
+            account_number="TEST002",
+            tiger_id="test_tiger_id_2",
+            private_key="test_private_key_2",
+            account_type=AccountType.PAPER,
+            environment="sandbox",
+            market_permissions=[MarketPermission.US_STOCK, MarketPermission.HK_STOCK],
+            description="Second test account for isolation testing",
+        )
+        test_accounts.append(account2)
+        logger.info("Created account 2: {} ({})", account2.account_name, account2.id)
+
+        return test_accounts
+
+    except Exception as e:
+        logger.error("Failed to create test accounts: {}", e)
+        return test_accounts
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_accounts():
+    """
+    Create test accounts once per session and delete them afterwards.
+
+    The process_manager fixture teardown normally deletes them already, so
+    that cleanup overlaps with stopping the worker processes; whatever it
+    did not delete (or all of them, if it never ran) is deleted here.
+    """
+    accounts = await create_test_accounts()
+    if not accounts:
+        pytest.skip("Failed to create test accounts")
+
+    yield accounts
+
+    if accounts:
+        await cleanup_test_accounts(accounts)
+
+
+@pytest.fixture(scope="session")
+def account_ids(test_accounts) -> List[str]:
+    """String IDs of the test accounts, converted once per session."""
+    return [str(account.id) for account in test_accounts]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def process_manager(test_accounts):
+    """Start one process manager for the whole session."""
+    manager = get_process_manager()
+    await manager.start()
+    logger.info("Process manager started successfully")
+
+    yield manager
+
+    # Workers only read their account at startup, so the rows can be
+    # deleted while the processes are shutting down.
+    stop_result, cleanup_result = await asyncio.gather(
+        manager.stop(),
+        cleanup_test_accounts(test_accounts),
+        return_exceptions=True,
+    )
+
+    if isinstance(stop_result, Exception):
+        logger.error("Failed to stop process manager: {}", stop_result)
+    else:
+        logger.info("Process manager stopped")
+
+    if isinstance(cleanup_result, Exception):
+        logger.error("Failed to clean up test accounts: {}", cleanup_result)
+
+
+async def test_process_manager_startup(process_manager: ProcessManager):
+    """Test process manager startup and basic functionality."""
+    logger.info("=== Testing Process Manager Startup ===")
+
+    # Get initial system metrics
+    metrics = await process_manager.get_system_metrics()
+    logger.info("Initial system metrics: {}", metrics)
+
+    assert "error" not in metrics
+
+
+async def test_process_creation_and_isolation(
+    process_manager: ProcessManager, account_ids: List[str]
+):
+    """Test process creation and account isolation."""
+    logger.info("=== Testing Process Creation and Isolation ===")
+
+    if len(account_ids) < 2:
+        pytest.skip("Need at least 2 accounts for isolation testing")
+
+    account1_id, account2_id = account_ids[:2]
+
+    # This should trigger process creation for both accounts
+    logger.info(
+        "Testing process creation for accounts {}, {}", account1_id, account2_id
+    )
+    results = await asyncio.gather(
+        process_manager.execute_api_call(
+            account_id=account1_id, method="health_check", timeout=15.0
+        ),
+        process_manager.execute_api_call(
+            account_id=account2_id, method="health_check", timeout=15.0
+        ),
+        return_exceptions=True,
+    )
+    for number, result in enumerate(results, start=1):
+        if isinstance(result, Exception):
+            logger.error("Account {} health check failed: {}", number, result)
+        else:
+            logger.info("Account {} health check result: {}", number, result)
+
+    # Fail fast if either account has no process before reporting on them
+    processes = await process_manager.get_all_process_status()
+    by_account = {process.account_id: process for process in processes}
+    assert (account1_process := by_account.get(account1_id))
+    assert (account2_process := by_account.get(account2_id))
+
+    lines = [f"Total processes created: {len(processes)}"]
+    lines.extend(
+        f"Process {process.process_id[:8]}: "
+        f"Account {process.account_number}, Status {process.status.value}"
+        for process in processes
+    )
+    logger.info("\n".join(lines))
+
+    # Test that each account has its own process
+    assert account1_process.process_id != account2_process.process_id
+    logger.info("✓ Account isolation verified - each account has separate process")
+
+
+async def test_api_calls(process_manager: ProcessManager, account_ids: List[str]):
+    """Test various API calls through the process pool."""
+    logger.info("=== Testing API Calls ===")
+
+    assert await wait_for_accounts_ready(process_manager, account_ids)
+    account_id = account_ids[0]
+
+    # All calls travel to the worker as one batch task and run there in order
+    logger.info("Testing API calls: {}", ", ".join(call.method for call in TEST_CALLS))
+    start_time = datetime.utcnow()
+
+    try:
+        results = await process_manager.execute_api_calls(
+            account_id, TEST_CALLS, timeout=10.0 * len(TEST_CALLS)
+        )
+    except TimeoutError:
+        logger.error("✗ API call batch timed out")
+        return
+
+    execution_time = (datetime.utcnow() - start_time).total_seconds()
+    logger.info("Batch of {} calls completed in {:.2f}s", len(results), execution_time)
+
+    assert len(results) == len(TEST_CALLS)
+    for call, result in zip(TEST_CALLS, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "✗ {} failed (expected in test env): {}", call.method, result
+            )
+        else:
+            logger.info("✓ {} completed", call.method)
+            logger.opt(lazy=True).debug("Result: {}", lambda: result)
+
+
+async def test_process_restart(process_manager: ProcessManager, account_ids: List[str]):
+    """Test process restart functionality."""
+    logger.info("=== Testing Process Restart ===")
+
+    assert await wait_for_accounts_ready(process_manager, account_ids)
+    account_id = account_ids[0]
+
+    # Get current process info
+    process_before = await process_manager.get_account_process_status(account_id)
+    if not process_before:
+        pytest.skip("No process found to restart")
+
+    logger.info(
+        "Current process: {} (PID: {})",
+        process_before.process_id[:8],
+        process_before.pid,
+    )
+
+    # Restart the process
+    logger.info("Restarting process...")
+    restart_success = await process_manager.restart_account_process(account_id)
+    assert restart_success
+
+    logger.info("✓ Process restart initiated successfully")
+
+    # Wait for the restarted worker to signal ready
+    assert await process_manager.wait_for_ready(account_id, timeout=5.0)
+
+    # Get new process info
+    process_after = await process_manager.get_account_process_status(account_id)
+
+    # The pool reuses the process ID, so a new worker shows up as a new PID
+    assert process_after
+    assert process_after.pid != process_before.pid
+    logger.info("✓ Process restart verified - new process created")
+    logger.info(
+        "New process: {} (PID: {})", process_after.process_id[:8], process_after.pid
+    )
+
+
+async def check_metrics_and_monitoring(process_manager: ProcessManager):
+    """Check metrics collection and monitoring."""
+    logger.info("=== Testing Metrics and Monitoring ===")
+
+    # Get system metrics
+    system_metrics = await process_manager.get_system_metrics()
+    logger.info(
+        "\n".join(
+            ["System metrics:"]
+            + [f"  {key}: {value}" for key, value in system_metrics.items()]
+        )
+    )
+
+    # Get process metrics
+    process_metrics = await process_manager.get_process_metrics()
+    lines = [f"Process metrics for {len(process_metrics)} processes:"]
+    lines.extend(
+        f"  Process {process_id[:8]}: tasks={metrics.total_tasks} "
+        f"success={metrics.success_rate:.1f}% "
+        f"avg_rt={metrics.average_response_time:.3f}s "
+        f"uptime={metrics.uptime_seconds:.1f}s"
+        for process_id, metrics in process_metrics.items()
+    )
+    logger.info("\n".join(lines))
+
+
+async def check_health_checks(process_manager: ProcessManager):
+    """Check health check functionality."""
+    logger.info("=== Testing Health Checks ===")
+
+    # Run health checks on all accounts
+    health_results = await process_manager.health_check_all_accounts()
+
+    lines = [f"Health check results for {len(health_results)} accounts:"]
+    for result in health_results:
+        short_id = result["account_id"][:8]
+        if result["healthy"]:
+            lines.append(f"  Account {short_id}: ✓ HEALTHY")
+        else:
+            lines.append(f"  Account {short_id}: ✗ UNHEALTHY")
+            lines.append(f"    Error: {result.get('error', 'Unknown')}")
+    logger.info("\n".join(lines))
+
+
+async def test_metrics_and_health_checks(process_manager: ProcessManager):
+    """Test metrics and health checks, which are independent, concurrently."""
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(check_metrics_and_monitoring(process_manager))
+        tg.create_task(check_health_checks(process_manager))
+
+
+async def wait_for_accounts_ready(
+    process_manager: ProcessManager, account_ids: List[str], timeout: float = 5.0
+) -> bool:
+    """Wait until every test account that has a worker process is ready."""
+    processes = await asyncio.gather(
+        *(
+            process_manager.get_account_process_status(account_id)
+            for account_id in account_ids
+        )
+    )
+    ready = await asyncio.gather(
+        *(
+            process_manager.wait_for_ready(account_id, timeout=timeout)
+            for account_id, process in zip(account_ids, processes)
+            if process
+        )
+    )
+    return all(ready)
+
+
+async def cleanup_test_accounts(test_accounts: List):
+    """Clean up test accounts, removing each deleted one from test_accounts."""
+    logger.info("=== Cleaning Up Test Accounts ===")
+
+    account_manager = get_account_manager()
+
+    results = await asyncio.gather(
+        *(
+            account_manager.delete_account(account.id, force=True)
+            for account in test_accounts
+        ),
+        return_exceptions=True,
+    )
+
+    for account, result in zip(list(test_accounts), results):
+        # gather() also returns CancelledError, which is not an Exception
+        if isinstance(result, BaseException):
+            logger.error(
+                "Failed to delete account {}: {}", account.account_name, result
+            )
+        else:
+            test_accounts.remove(account)
+            logger.info("Deleted test account: {}", account.account_name)
+
+
+if __name__ == "__main__":
+    # Configure logging
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+        "<cyan>test</cyan> | <level>{message}</level>",
+        level="INFO",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
+
+    # Run tests
+    sys.exit(pytest.main([__file__, "-p", "no:cacheprovider", "-o", "addopts=", "-s"]))
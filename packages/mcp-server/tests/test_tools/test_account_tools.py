@@ -20,6 +20,7 @@ import pytest
 
 # Import the tools under test
 from mcp_server.tools.account_tools import (
+    AccountToolsService,
     tiger_add_account,
     tiger_get_account_status,
     tiger_list_accounts,
@@ -650,3 +651,43 @@ class TestAccountToolsIntegration:
         print(
             f"Account tools performance test: {len(tasks)} operations completed in {execution_time:.2f} seconds"
         )
+
+
+class TestAccountToolsService:
+    """Test suite for the service behind the account tools."""
+
+    @pytest.fixture
+    def service(self, tool_account_manager):
+        """Create an AccountToolsService with a mocked account manager."""
+        return AccountToolsService(list_cache_ttl=30.0)
+
+    @pytest.mark.asyncio
+    async def test_listing_cached_per_filter(self, service):
+        """Test repeated polls with the same filters reuse one query."""
+        first = await service.list_formatted_accounts(None, None, None, False)
+        second = await service.list_formatted_accounts(None, None, None, False)
+        await service.list_formatted_accounts(None, None, "sandbox", False)
+
+        assert first is second
+        assert first[0]["market_permissions"] == ["us_stock"]
+        assert service.account_manager.list_accounts.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_listing_cache_invalidated(self, service):
+        """Test account changes force the next listing to query again."""
+        await service.list_formatted_accounts(None, None, None, False)
+        # The service registers itself with the manager's change notifications
+        listener = service.account_manager.add_change_listener.call_args.args[0]
+        listener()
+        await service.list_formatted_accounts(None, None, None, False)
+
+        assert service.account_manager.list_accounts.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_listing_cache_evicts_oldest(self, service):
+        """Test the listing cache stays bounded, dropping the oldest filter."""
+        service.list_cache_size = 2
+        for environment in ("sandbox", "production", "paper"):
+            await service.list_formatted_accounts(None, None, environment, False)
+
+        assert [key[2] for key in service._list_cache] == ["production", "paper"]
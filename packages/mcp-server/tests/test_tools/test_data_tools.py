@@ -11,12 +11,17 @@ Tests all 6 data fetching tools:
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 # Import the tools under test
 from mcp_server.tools.data_tools import (
+    MAX_BATCH_SYMBOLS,
+    DataToolsService,
+    MarketStatusResponse,
+    _QuoteCoalescer,
     tiger_get_kline,
     tiger_get_market_data,
     tiger_get_market_status,
@@ -535,3 +540,150 @@ class TestDataToolsIntegration:
         logger.info(
             f"Stress test completed {len(symbols)} requests in {execution_time:.2f} seconds"
         )
+
+
+class TestQuoteCoalescer:
+    """Test suite for coalescing concurrent quote requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_quotes_share_one_fetch(self):
+        """Test concurrent requests for one account issue a single fetch."""
+        fetch = AsyncMock(
+            side_effect=lambda account_id, symbols: [
+                SimpleNamespace(symbol=symbol, latest_price=1.0) for symbol in symbols
+            ]
+        )
+        coalescer = _QuoteCoalescer(fetch)
+
+        briefs = await asyncio.gather(
+            coalescer.get("acct", "AAPL"),
+            coalescer.get("acct", "MSFT"),
+            coalescer.get("acct", "AAPL"),
+        )
+
+        assert [brief.symbol for brief in briefs] == ["AAPL", "MSFT", "AAPL"]
+        fetch.assert_awaited_once_with("acct", ["AAPL", "MSFT"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_reaches_every_request(self):
+        """Test a failed batch fetch fails each waiting request."""
+        coalescer = _QuoteCoalescer(AsyncMock(side_effect=RuntimeError("boom")))
+
+        results = await asyncio.gather(
+            coalescer.get("acct", "AAPL"),
+            coalescer.get("acct", "MSFT"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_large_batches_split_into_chunks(self):
+        """Test a flush never sends more than MAX_BATCH_SYMBOLS symbols."""
+        fetch = AsyncMock(
+            side_effect=lambda account_id, symbols: [
+                SimpleNamespace(symbol=symbol) for symbol in symbols
+            ]
+        )
+        coalescer = _QuoteCoalescer(fetch)
+        symbols = [f"SYM{index}" for index in range(MAX_BATCH_SYMBOLS + 10)]
+
+        briefs = await asyncio.gather(
+            *(coalescer.get("acct", symbol) for symbol in symbols)
+        )
+
+        assert [brief.symbol for brief in briefs] == symbols
+        assert [len(call.args[1]) for call in fetch.await_args_list] == [
+            MAX_BATCH_SYMBOLS,
+            10,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_symbols_matched_case_insensitively(self):
+        """Test lower-case requests share and match upper-case briefs."""
+        fetch = AsyncMock(
+            side_effect=lambda account_id, symbols: [
+                SimpleNamespace(symbol=symbol) for symbol in symbols
+            ]
+        )
+        coalescer = _QuoteCoalescer(fetch)
+
+        briefs = await asyncio.gather(
+            coalescer.get("acct", "aapl"), coalescer.get("acct", "AAPL")
+        )
+
+        assert [brief.symbol for brief in briefs] == ["AAPL", "AAPL"]
+        fetch.assert_awaited_once_with("acct", ["AAPL"])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_fails_waiters(self):
+        """Test cancelling an in-progress flush does not leave requests hanging."""
+        started = asyncio.Event()
+
+        async def fetch(account_id, symbols):
+            started.set()
+            await asyncio.sleep(10)
+
+        coalescer = _QuoteCoalescer(fetch)
+        request = asyncio.ensure_future(coalescer.get("acct", "AAPL"))
+        await started.wait()
+        for flush in coalescer._flushes:
+            flush.cancel()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(request, timeout=1.0)
+
+
+class TestDataToolsService:
+    """Test suite for the service behind the data tools."""
+
+    @pytest.fixture
+    def service(self, tool_account_manager):
+        """Create a DataToolsService with a mocked account manager."""
+        return DataToolsService()
+
+    @pytest.mark.asyncio
+    async def test_default_route_cached(self, service):
+        """Test the default account is looked up once per TTL."""
+        assert await service._route_account(None) == "DATA001"
+        assert await service._route_account(None) == "DATA001"
+        assert await service._route_account("explicit") == "explicit"
+
+        service.account_manager.get_default_account.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_account_change_invalidates_route(self, service):
+        """Test account changes drop cached routes through the listener."""
+        service.account_manager.add_change_listener.assert_called_once_with(
+            service.invalidate_routes
+        )
+        await service._route_account(None)
+
+        service.invalidate_routes()
+        await service._route_account(None)
+
+        assert service.account_manager.get_default_account.await_count == 2
+
+    def test_cached_response_restamped_until_ttl(self, service):
+        """Test cached responses are reused with a fresh timestamp."""
+        response = MarketStatusResponse(
+            success=True, market="US", timestamp="2024-01-01T00:00:00"
+        )
+        service.cache_response("market_status", ("US", None), response)
+
+        cached = service.get_cached_response("market_status", ("US", None))
+        assert cached.market == "US"
+        assert cached.timestamp != response.timestamp
+
+        service._response_ttls["market_status"] = 0.0
+        assert service.get_cached_response("market_status", ("US", None)) is None
+
+    def test_response_cache_evicts_oldest(self, service):
+        """Test the response cache stays within its size."""
+        service.response_cache_size = 2
+        for market in ("US", "HK", "SG"):
+            response = MarketStatusResponse(success=True, market=market)
+            service.cache_response("market_status", (market, None), response)
+
+        assert service.get_cached_response("market_status", ("US", None)) is None
+        assert service.get_cached_response("market_status", ("SG", None)) is not None
@@ -7,7 +7,7 @@ credential management, and database operations using async/await patterns.
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from loguru import logger
 from sqlalchemy import and_, or_, select, update
@@ -77,8 +77,26 @@ class TigerAccountManager:
         """Initialize account manager."""
         self._config = get_config()
         self._encryption_service = get_encryption_service()
+        self._change_listeners: List[Callable[[], None]] = []
         logger.info("TigerAccountManager initialized")
 
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback run after accounts are added, changed or removed.
+
+        Listeners let callers drop anything they cache about accounts, such
+        as routed default accounts, as soon as it may be stale.
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        """Run change listeners; a failing listener is logged and skipped."""
+        for listener in self._change_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Account change listener failed: {e}")
+
     async def create_account(
         self,
         account_name: str,
@@ -196,6 +214,7 @@ class TigerAccountManager:
                 session.add(initial_token_status)
 
                 await session.commit()
+                self._notify_change()
 
                 logger.info(
                     f"Created Tiger account: {account_name} ({account_number}) "
@@ -264,6 +283,7 @@ class TigerAccountManager:
         environment: Optional[TigerEnvironment] = None,
         license: Optional[TigerLicense] = None,
         include_inactive: bool = False,
+        load_relationships: bool = True,
     ) -> List[TigerAccount]:
         """
         List accounts with optional filtering.
@@ -274,16 +294,20 @@ class TigerAccountManager:
             environment: Filter by environment (PROD/SANDBOX)
             license: Filter by license (TBHK, TBSG, TBNZ, etc.)
             include_inactive: Include inactive accounts
+            load_relationships: Eager-load token statuses and API keys; callers
+                that only read account columns can skip the extra queries
 
         Returns:
             List of TigerAccount instances
         """
         try:
             async with get_session() as session:
-                stmt = select(TigerAccount).options(
-                    selectinload(TigerAccount.token_statuses),
-                    selectinload(TigerAccount.api_keys),
-                )
+                stmt = select(TigerAccount)
+                if load_relationships:
+                    stmt = stmt.options(
+                        selectinload(TigerAccount.token_statuses),
+                        selectinload(TigerAccount.api_keys),
+                    )
 
                 # Build filters
                 filters = []
@@ -377,6 +401,7 @@ class TigerAccountManager:
                 account.updated_at = datetime.utcnow()
 
                 await session.commit()
+                self._notify_change()
 
                 logger.info(f"Updated account {account.account_name} ({account_id})")
                 return account
@@ -418,6 +443,7 @@ class TigerAccountManager:
                 # Remove from session
                 await session.delete(account)
                 await session.commit()
+                self._notify_change()
 
                 logger.info(f"Deleted account {account.account_name} ({account_id})")
                 return True
@@ -487,6 +513,7 @@ class TigerAccountManager:
 
                 account.is_default_trading = True
                 await session.commit()
+                self._notify_change()
 
                 logger.info(f"Set {account.account_name} as default trading account")
                 return account
@@ -522,6 +549,7 @@ class TigerAccountManager:
 
                 account.is_default_data = True
                 await session.commit()
+                self._notify_change()
 
                 logger.info(f"Set {account.account_name} as default data account")
                 return account
@@ -577,6 +605,10 @@ class TigerAccountManager:
                 account.increment_error_count(error_message)
 
                 # Auto-suspend if too many errors
+                suspended = (
+                    account.error_count >= 10
+                    and account.status != AccountStatus.SUSPENDED
+                )
                 if account.error_count >= 10:
                     account.status = AccountStatus.SUSPENDED
                     logger.warning(
@@ -584,6 +616,8 @@ class TigerAccountManager:
                     )
 
                 await session.commit()
+                if suspended:
+                    self._notify_change()
                 return account
 
         except AccountManagerError:
@@ -611,11 +645,14 @@ class TigerAccountManager:
                 account.reset_error_count()
 
                 # Reactivate if was suspended due to errors
-                if account.status == AccountStatus.SUSPENDED:
+                reactivated = account.status == AccountStatus.SUSPENDED
+                if reactivated:
                     account.status = AccountStatus.ACTIVE
                     logger.info(f"Reactivated account {account.account_name}")
 
                 await session.commit()
+                if reactivated:
+                    self._notify_change()
                 return account
 
         except AccountManagerError: